@@ -8,6 +8,9 @@ from ..security.sanitizer import InputSanitizer
 from .llm_manager import LLMManager
 from .prompt_builder import PromptBuilder
 
+# Statement types accepted from the LLM, matched case-insensitively without copying the query
+_VALID_SQL_START_RE = re.compile(r'\s*(?:SELECT|WITH|SHOW|DESCRIBE|EXPLAIN)', re.IGNORECASE)
+
 
 class QueryGenerator:
     """
@@ -256,10 +259,7 @@ Suggestions:"""
             return False
         
         # Check for basic SQL structure
-        sql_upper = sql_query.upper()
-        valid_starts = ['SELECT', 'WITH', 'SHOW', 'DESCRIBE', 'EXPLAIN']
-        
-        return any(sql_upper.strip().startswith(start) for start in valid_starts)
+        return _VALID_SQL_START_RE.match(sql_query) is not None
     
     def _parse_sql_to_intent(self, sql_query: str, schema: Dict[str, Dict[str, str]]) -> QueryIntent:
         """
@@ -280,16 +280,16 @@ Suggestions:"""
         if select_match:
             column_str = select_match.group(1)
             if column_str.strip() == '*':
-                columns = [Column('*')]
+                columns = [Column.intern('*')]
             else:
                 # Simple split by comma (doesn't handle complex cases)
                 for col in column_str.split(','):
                     col = col.strip()
                     if ' AS ' in col.upper():
                         parts = re.split(r'\s+AS\s+', col, flags=re.IGNORECASE)
-                        columns.append(Column(parts[0].strip(), alias=parts[1].strip()))
+                        columns.append(Column.intern(parts[0].strip(), alias=parts[1].strip()))
                     else:
-                        columns.append(Column(col))
+                        columns.append(Column.intern(col))
         
         # Create basic QueryIntent
         intent = QueryIntent(
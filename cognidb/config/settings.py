@@ -1,12 +1,24 @@
 """Settings and configuration classes."""
 
+from __future__ import annotations
+
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from functools import cached_property
+from typing import Dict, Iterator, List, Optional, Any
 from enum import Enum, auto
 import os
 from pathlib import Path
 
 
+# Default locations, resolved once at import
+_HOME = Path.home()
+_COGNIDB_DIR = _HOME / ".cognidb"
+_DATA_DIR = str(_COGNIDB_DIR)
+_CACHE_DIR = str(_COGNIDB_DIR / "cache")
+_AUDIT_LOG = str(_COGNIDB_DIR / "audit.log")
+_LOG_DIR = str(_COGNIDB_DIR / "logs")
+
+
 class DatabaseType(Enum):
     """Supported database types."""
     MYSQL = "mysql"
@@ -62,8 +74,9 @@ class DatabaseConfig:
     # Additional options
     options: Dict[str, Any] = field(default_factory=dict)
     
-    def get_connection_string(self) -> str:
-        """Generate connection string (without password)."""
+    @cached_property
+    def connection_string(self) -> str:
+        """Connection string (without password), built once per config."""
         if self.type == DatabaseType.SQLITE:
             return f"sqlite:///{self.database}"
         
@@ -72,6 +85,10 @@ class DatabaseConfig:
             auth = f"{self.username}:***@"
         
         return f"{self.type.value}://{auth}{self.host}:{self.port}/{self.database}"
+    
+    def get_connection_string(self) -> str:
+        """Generate connection string (without password)."""
+        return self.connection_string
 
 
 @dataclass
@@ -131,7 +148,7 @@ class CacheConfig:
     redis_ssl: bool = False
     
     # Disk cache settings
-    disk_cache_path: str = str(Path.home() / ".cognidb" / "cache")
+    disk_cache_path: str = _CACHE_DIR
     
     # Performance settings
     enable_compression: bool = True
@@ -159,7 +176,7 @@ class SecurityConfig:
     
     # Audit logging
     enable_audit_logging: bool = True
-    audit_log_path: str = str(Path.home() / ".cognidb" / "audit.log")
+    audit_log_path: str = _AUDIT_LOG
     log_query_results: bool = False
     
     # Encryption
@@ -188,8 +205,8 @@ class Settings:
     log_level: str = "INFO"
     
     # Paths
-    data_dir: str = str(Path.home() / ".cognidb")
-    log_dir: str = str(Path.home() / ".cognidb" / "logs")
+    data_dir: str = _DATA_DIR
+    log_dir: str = _LOG_DIR
     
     # Feature flags
     enable_natural_language: bool = True
@@ -232,23 +249,29 @@ class Settings:
     
     def validate(self) -> List[str]:
         """Validate settings and return list of errors."""
-        errors = []
-        
+        return list(self._iter_errors())
+    
+    def is_valid(self) -> bool:
+        """Check settings validity, stopping at the first error."""
+        return next(self._iter_errors(), None) is None
+    
+    def _iter_errors(self) -> Iterator[str]:
+        """Yield validation errors lazily."""
         # Database validation
         if not self.database.host:
-            errors.append("Database host is required")
+            yield "Database host is required"
         if self.database.port <= 0 or self.database.port > 65535:
-            errors.append("Invalid database port")
+            yield "Invalid database port"
         
         # LLM validation
         if self.llm.provider != LLMProvider.LOCAL and not self.llm.api_key:
-            errors.append("LLM API key is required for non-local providers")
+            yield "LLM API key is required for non-local providers"
         if self.llm.temperature < 0 or self.llm.temperature > 2:
-            errors.append("LLM temperature must be between 0 and 2")
+            yield "LLM temperature must be between 0 and 2"
         
         # Security validation
         if self.security.encrypt_cache and not self.security.encryption_key:
-            errors.append("Encryption key required when encryption is enabled")
+            yield "Encryption key required when encryption is enabled"
         
         # Path validation
         for path_attr in ['data_dir', 'log_dir']:
@@ -256,6 +279,4 @@ class Settings:
             try:
                 Path(path).mkdir(parents=True, exist_ok=True)
             except Exception as e:
-                errors.append(f"Cannot create {path_attr}: {e}")
-        
-        return errors
\ No newline at end of file
+                yield f"Cannot create {path_attr}: {e}"
\ No newline at end of file
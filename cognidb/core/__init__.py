@@ -1,34 +1,37 @@
 """Core abstractions for CogniDB."""
 
-from .query_intent import QueryIntent, QueryType, JoinCondition, Aggregation
-from .interfaces import (
-    DatabaseDriver,
-    QueryTranslator,
-    SecurityValidator,
-    ResultNormalizer,
-    CacheProvider
-)
-from .exceptions import (
-    CogniDBError,
-    SecurityError,
-    TranslationError,
-    ExecutionError,
-    ValidationError
-)
+import importlib
 
-__all__ = [
-    'QueryIntent',
-    'QueryType',
-    'JoinCondition',
-    'Aggregation',
-    'DatabaseDriver',
-    'QueryTranslator',
-    'SecurityValidator',
-    'ResultNormalizer',
-    'CacheProvider',
-    'CogniDBError',
-    'SecurityError',
-    'TranslationError',
-    'ExecutionError',
-    'ValidationError'
-]
\ No newline at end of file
+# Public name -> submodule that defines it; submodules load on first access
+_LAZY = {
+    'QueryIntent': 'query_intent',
+    'QueryType': 'query_intent',
+    'JoinCondition': 'query_intent',
+    'Aggregation': 'query_intent',
+    'DatabaseDriver': 'interfaces',
+    'QueryTranslator': 'interfaces',
+    'SecurityValidator': 'interfaces',
+    'ResultNormalizer': 'interfaces',
+    'CacheProvider': 'interfaces',
+    'CogniDBError': 'exceptions',
+    'SecurityError': 'exceptions',
+    'TranslationError': 'exceptions',
+    'ExecutionError': 'exceptions',
+    'ValidationError': 'exceptions'
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    """Import the defining submodule on first access and cache the attribute."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -4,6 +4,8 @@
 class CogniDBError(Exception):
     """Base exception for all CogniDB errors."""
     
+    __slots__ = ('message', 'details')
+    
     def __init__(self, message: str, details: dict = None):
         super().__init__(message)
         self.message = message
@@ -12,47 +14,49 @@ class CogniDBError(Exception):
 
 class SecurityError(CogniDBError):
     """Raised when a security violation is detected."""
-    pass
+    __slots__ = ()
 
 
 class ValidationError(CogniDBError):
     """Raised when validation fails."""
-    pass
+    __slots__ = ()
 
 
 class TranslationError(CogniDBError):
     """Raised when query translation fails."""
-    pass
+    __slots__ = ()
 
 
 class ExecutionError(CogniDBError):
     """Raised when query execution fails."""
-    pass
+    __slots__ = ()
 
 
 class ConnectionError(CogniDBError):
     """Raised when database connection fails."""
-    pass
+    __slots__ = ()
 
 
 class SchemaError(CogniDBError):
     """Raised when schema-related operations fail."""
-    pass
+    __slots__ = ()
 
 
 class ConfigurationError(CogniDBError):
     """Raised when configuration is invalid."""
-    pass
+    __slots__ = ()
 
 
 class CacheError(CogniDBError):
     """Raised when cache operations fail."""
-    pass
+    __slots__ = ()
 
 
 class RateLimitError(CogniDBError):
     """Raised when rate limits are exceeded."""
     
+    __slots__ = ('retry_after',)
+    
     def __init__(self, message: str, retry_after: int = None, details: dict = None):
         super().__init__(message, details)
         self.retry_after = retry_after
\ No newline at end of file
@@ -1,24 +1,25 @@
 """Core interfaces for CogniDB components."""
 
-from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, Tuple
-from .query_intent import QueryIntent
+from __future__ import annotations
 
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple, Union, Protocol, runtime_checkable
 
-class DatabaseDriver(ABC):
-    """Abstract base class for database drivers."""
+if TYPE_CHECKING:
+    from .query_intent import QueryIntent
+
+
+@runtime_checkable
+class DatabaseDriver(Protocol):
+    """Structural interface for database drivers."""
     
-    @abstractmethod
     def connect(self) -> None:
         """Establish connection to the database."""
-        pass
+        ...
     
-    @abstractmethod
     def disconnect(self) -> None:
         """Close the database connection."""
-        pass
+        ...
     
-    @abstractmethod
     def execute_native_query(self, query: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Execute a native query with parameters.
@@ -30,9 +31,8 @@ class DatabaseDriver(ABC):
         Returns:
             List of result rows as dictionaries
         """
-        pass
+        ...
     
-    @abstractmethod
     def fetch_schema(self) -> Dict[str, Dict[str, str]]:
         """
         Fetch database schema.
@@ -47,40 +47,35 @@ class DatabaseDriver(ABC):
                 ...
             }
         """
-        pass
+        ...
     
-    @abstractmethod
     def validate_table_name(self, table_name: str) -> bool:
         """Validate that a table name exists and is safe."""
-        pass
+        ...
     
-    @abstractmethod
     def validate_column_name(self, table_name: str, column_name: str) -> bool:
         """Validate that a column exists in the table."""
-        pass
+        ...
     
-    @abstractmethod
     def get_connection_info(self) -> Dict[str, Any]:
         """Get connection information (for debugging, minus secrets)."""
-        pass
+        ...
     
     @property
-    @abstractmethod
     def supports_transactions(self) -> bool:
         """Whether this driver supports transactions."""
-        pass
+        ...
     
     @property
-    @abstractmethod
     def supports_schemas(self) -> bool:
         """Whether this database supports schemas/namespaces."""
-        pass
+        ...
 
 
-class QueryTranslator(ABC):
-    """Abstract base class for query translators."""
+@runtime_checkable
+class QueryTranslator(Protocol):
+    """Structural interface for query translators."""
     
-    @abstractmethod
     def translate(self, query_intent: QueryIntent) -> Tuple[str, Dict[str, Any]]:
         """
         Translate a QueryIntent into a native query.
@@ -91,9 +86,8 @@ class QueryTranslator(ABC):
         Returns:
             Tuple of (query_string, parameters_dict)
         """
-        pass
+        ...
     
-    @abstractmethod
     def validate_intent(self, query_intent: QueryIntent) -> List[str]:
         """
         Validate that the query intent can be translated.
@@ -101,10 +95,9 @@ class QueryTranslator(ABC):
         Returns:
             List of validation errors (empty if valid)
         """
-        pass
+        ...
     
     @property
-    @abstractmethod
     def supported_features(self) -> Dict[str, bool]:
         """
         Return supported features for this translator.
@@ -117,13 +110,16 @@ class QueryTranslator(ABC):
                 'cte': False
             }
         """
-        pass
+        ...
 
 
-class SecurityValidator(ABC):
-    """Abstract base class for security validators."""
+@runtime_checkable
+class SecurityValidator(Protocol):
+    """Structural interface for security validators."""
+    
+    # No instance __dict__, so slotted implementations stay dict-free
+    __slots__ = ()
     
-    @abstractmethod
     def validate_query_intent(self, query_intent: QueryIntent) -> Tuple[bool, Optional[str]]:
         """
         Validate query intent for security issues.
@@ -131,9 +127,8 @@ class SecurityValidator(ABC):
         Returns:
             Tuple of (is_valid, error_message)
         """
-        pass
+        ...
     
-    @abstractmethod
     def validate_native_query(self, query: str) -> Tuple[bool, Optional[str]]:
         """
         Validate native query for security issues.
@@ -141,29 +136,29 @@ class SecurityValidator(ABC):
         Returns:
             Tuple of (is_valid, error_message)
         """
-        pass
+        ...
     
-    @abstractmethod
     def sanitize_identifier(self, identifier: str) -> str:
         """Sanitize a table/column identifier."""
-        pass
+        ...
     
-    @abstractmethod
     def sanitize_value(self, value: Any) -> Any:
         """Sanitize a parameter value."""
-        pass
+        ...
     
     @property
-    @abstractmethod
     def allowed_operations(self) -> List[str]:
         """List of allowed query operations."""
-        pass
+        ...
 
 
-class ResultNormalizer(ABC):
-    """Abstract base class for result normalizers."""
+@runtime_checkable
+class ResultNormalizer(Protocol):
+    """Structural interface for result normalizers."""
+    
+    # Whether callers should prefer normalize_columnar for large result sets
+    prefers_columnar: bool = False
     
-    @abstractmethod
     def normalize(self, raw_results: Any) -> List[Dict[str, Any]]:
         """
         Normalize database-specific results to standard format.
@@ -174,34 +169,52 @@ class ResultNormalizer(ABC):
         Returns:
             List of dictionaries with consistent structure
         """
-        pass
+        ...
+    
+    def normalize_columnar(self, raw_results: Any) -> Dict[str, List[Any]]:
+        """
+        Normalize database-specific results to columnar format.
+        
+        Avoids building one dictionary per row for wide or large
+        result sets.
+        
+        Args:
+            raw_results: Raw results from database driver
+            
+        Returns:
+            Dictionary mapping column names to lists of values:
+            {
+                'column_name': [value_row_1, value_row_2, ...],
+                ...
+            }
+        """
+        ...
     
-    @abstractmethod
     def format_for_output(self, 
-                         normalized_results: List[Dict[str, Any]], 
+                         normalized_results: Union[List[Dict[str, Any]], Dict[str, List[Any]]], 
                          output_format: str = 'json') -> Any:
         """
         Format normalized results for final output.
         
         Args:
-            normalized_results: Normalized result set
-            output_format: One of 'json', 'csv', 'table', 'dataframe'
+            normalized_results: Normalized result set, row-oriented or columnar
+            output_format: One of 'json', 'csv', 'table', 'dataframe', 'arrow'
+                ('arrow' returns a pyarrow.Table, e.g. via pyarrow.Table.from_pydict)
             
         Returns:
             Formatted results
         """
-        pass
+        ...
 
 
-class CacheProvider(ABC):
-    """Abstract base class for cache providers."""
+@runtime_checkable
+class CacheProvider(Protocol):
+    """Structural interface for cache providers."""
     
-    @abstractmethod
     def get(self, key: str) -> Optional[Any]:
         """Retrieve value from cache."""
-        pass
+        ...
     
-    @abstractmethod
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         """
         Store value in cache.
@@ -214,19 +227,16 @@ class CacheProvider(ABC):
         Returns:
             Success status
         """
-        pass
+        ...
     
-    @abstractmethod
     def delete(self, key: str) -> bool:
         """Delete value from cache."""
-        pass
+        ...
     
-    @abstractmethod
     def clear(self) -> bool:
         """Clear all cached values."""
-        pass
+        ...
     
-    @abstractmethod
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        pass
\ No newline at end of file
+        ...
\ No newline at end of file
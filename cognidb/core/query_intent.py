@@ -1,6 +1,9 @@
 """Query intent representation - database agnostic query structure."""
 
-from dataclasses import dataclass, field
+from __future__ import annotations
+
+import functools
+from dataclasses import dataclass, field, replace
 from enum import Enum, auto
 from typing import List, Optional, Dict, Any, Union
 
@@ -30,6 +33,12 @@ class ComparisonOperator(Enum):
     BETWEEN = "BETWEEN"
 
 
+# Value shapes accepted by multi-value operators
+_SEQ_TYPES = (list, tuple, set)
+_PAIR_TYPES = (list, tuple)
+_IN_OPS = frozenset({ComparisonOperator.IN, ComparisonOperator.NOT_IN})
+
+
 class LogicalOperator(Enum):
     """Logical operators for combining conditions."""
     AND = "AND"
@@ -54,20 +63,27 @@ class JoinType(Enum):
     FULL = "FULL"
 
 
-@dataclass
+@dataclass(frozen=True)
 class Column:
     """Represents a column reference."""
     name: str
     table: Optional[str] = None
     alias: Optional[str] = None
     
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def intern(cls, name: str, table: Optional[str] = None,
+               alias: Optional[str] = None) -> 'Column':
+        """Return the canonical shared instance for this column reference."""
+        return cls(name, table, alias)
+    
     def __str__(self) -> str:
         if self.table:
             return f"{self.table}.{self.name}"
         return self.name
 
 
-@dataclass
+@dataclass(frozen=True)
 class Condition:
     """Represents a query condition."""
     column: Column
@@ -77,11 +93,25 @@ class Condition:
     def __post_init__(self):
         """Validate condition parameters."""
         if self.operator == ComparisonOperator.BETWEEN:
-            if not isinstance(self.value, (list, tuple)) or len(self.value) != 2:
+            if not isinstance(self.value, _PAIR_TYPES) or len(self.value) != 2:
                 raise ValueError("BETWEEN operator requires a list/tuple of two values")
-        elif self.operator in (ComparisonOperator.IN, ComparisonOperator.NOT_IN):
-            if not isinstance(self.value, (list, tuple, set)):
+        elif self.operator in _IN_OPS:
+            if not isinstance(self.value, _SEQ_TYPES):
                 raise ValueError(f"{self.operator.value} operator requires a list/tuple/set")
+    
+    def freeze(self) -> 'Condition':
+        """Return a hashable condition, converting list/set values to tuples."""
+        if isinstance(self.value, (list, set)):
+            return replace(self, value=tuple(self.value))
+        return self
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert condition to dict."""
+        return {
+            'column': str(self.column),
+            'operator': self.operator.value,
+            'value': self.value
+        }
 
 
 @dataclass
@@ -92,7 +122,25 @@ class ConditionGroup:
     
     def add_condition(self, condition: Union[Condition, 'ConditionGroup']):
         """Add a condition to the group."""
+        if isinstance(self.conditions, tuple):
+            raise ValueError("Cannot add conditions to a frozen condition group")
         self.conditions.append(condition)
+    
+    def freeze(self) -> 'ConditionGroup':
+        """Freeze the group (recursively) into tuples once building is done."""
+        self.conditions = tuple(c.freeze() for c in self.conditions)
+        return self
+    
+    def __hash__(self) -> int:
+        # Only frozen groups hash; a list of conditions raises TypeError
+        return hash((self.operator, self.conditions))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert condition group to dict."""
+        return {
+            'operator': self.operator.value,
+            'conditions': [c.to_dict() for c in self.conditions]
+        }
 
 
 @dataclass
@@ -158,7 +206,7 @@ class QueryIntent:
         
         if self.query_type == QueryType.SELECT and not self.columns:
             # Default to all columns if none specified
-            self.columns = [Column("*")]
+            self.columns = [Column.intern("*")]
         
         if self.aggregations and not self.group_by:
             # Check if all columns are aggregated
@@ -177,7 +225,7 @@ class QueryIntent:
     def add_column(self, column: Union[str, Column]):
         """Add a column to select."""
         if isinstance(column, str):
-            column = Column(column)
+            column = Column.intern(column)
         self.columns.append(column)
     
     def add_condition(self, condition: Condition):
@@ -186,6 +234,19 @@ class QueryIntent:
             self.conditions = ConditionGroup([])
         self.conditions.add_condition(condition)
     
+    def freeze(self) -> 'QueryIntent':
+        """
+        Freeze condition groups once the intent is fully built.
+        
+        Frozen groups iterate as tuples and are hashable, so they can
+        be used directly in cache keys.
+        """
+        if self.conditions:
+            self.conditions.freeze()
+        if self.having:
+            self.having.freeze()
+        return self
+    
     def add_join(self, join: JoinCondition):
         """Add a join condition."""
         self.joins.append(join)
@@ -210,11 +271,11 @@ class QueryIntent:
             'query_type': self.query_type.name,
             'tables': self.tables,
             'columns': [str(col) for col in self.columns],
-            'conditions': self._condition_group_to_dict(self.conditions) if self.conditions else None,
+            'conditions': self.conditions.to_dict() if self.conditions else None,
             'joins': [self._join_to_dict(j) for j in self.joins],
             'aggregations': [str(agg) for agg in self.aggregations],
             'group_by': [str(col) for col in self.group_by],
-            'having': self._condition_group_to_dict(self.having) if self.having else None,
+            'having': self.having.to_dict() if self.having else None,
             'order_by': [{'column': str(ob.column), 'asc': ob.ascending} for ob in self.order_by],
             'limit': self.limit,
             'offset': self.offset,
@@ -222,25 +283,6 @@ class QueryIntent:
             'natural_language_query': self.natural_language_query
         }
     
-    def _condition_group_to_dict(self, group: ConditionGroup) -> Dict[str, Any]:
-        """Convert condition group to dict."""
-        return {
-            'operator': group.operator.value,
-            'conditions': [
-                self._condition_to_dict(c) if isinstance(c, Condition) 
-                else self._condition_group_to_dict(c)
-                for c in group.conditions
-            ]
-        }
-    
-    def _condition_to_dict(self, condition: Condition) -> Dict[str, Any]:
-        """Convert condition to dict."""
-        return {
-            'column': str(condition.column),
-            'operator': condition.operator.value,
-            'value': condition.value
-        }
-    
     def _join_to_dict(self, join: JoinCondition) -> Dict[str, Any]:
         """Convert join to dict."""
         return {
@@ -1,6 +1,7 @@
 """Database drivers module."""
 
 from .mysql_driver import MySQLDriver
+from .mysql_async_driver import AsyncMySQLDriver
 from .postgres_driver import PostgreSQLDriver
 from .mongodb_driver import MongoDBDriver
 from .dynamodb_driver import DynamoDBDriver
@@ -8,6 +9,7 @@ from .sqlite_driver import SQLiteDriver
 
 __all__ = [
     'MySQLDriver',
+    'AsyncMySQLDriver',
     'PostgreSQLDriver',
     'MongoDBDriver',
     'DynamoDBDriver',
@@ -1,8 +1,11 @@
 """Base implementation for database drivers with common functionality."""
 
+import sys
 import time
+import random
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+import threading
+from typing import Callable, Dict, Iterable, List, Any, Optional, Tuple
 from contextlib import contextmanager
 from abc import abstractmethod
 from ..core.interfaces import DatabaseDriver
@@ -11,6 +14,12 @@ from ..security.sanitizer import InputSanitizer
 
 logger = logging.getLogger(__name__)
 
+# Per-process offset so background refreshes across workers don't expire together
+_SCHEMA_REFRESH_JITTER = random.uniform(0, 60)
+
+# InputSanitizer holds no state; one instance is shared by all drivers
+_SANITIZER = InputSanitizer()
+
 
 class BaseDriver(DatabaseDriver):
     """
@@ -24,6 +33,11 @@ class BaseDriver(DatabaseDriver):
     - Error handling
     """
     
+    # Process-wide schema cache shared by drivers pointing at the same database
+    _SHARED_SCHEMA: Dict[Tuple, Dict[str, Any]] = {}
+    _SHARED_REFRESHERS: set = set()
+    _SHARED_LOCK = threading.Lock()
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize base driver.
@@ -33,10 +47,12 @@ class BaseDriver(DatabaseDriver):
         """
         self.config = config
         self.connection = None
-        self.schema_cache = None
-        self.schema_cache_time = 0
+        # (schema, expiry) swapped in as one object so readers never see a torn pair
+        self._schema_snapshot: Optional[Tuple[Dict[str, Dict[str, str]], float]] = None
+        # Shared cache entry the snapshot came from; it stays current while still published there
+        self._schema_entry: Optional[Dict[str, Any]] = None
         self.schema_cache_ttl = 3600  # 1 hour
-        self.sanitizer = InputSanitizer()
+        self.sanitizer = _SANITIZER
         self._connection_time = None
         
     @contextmanager
@@ -71,80 +87,227 @@ class BaseDriver(DatabaseDriver):
             raise ConnectionError("Not connected to database")
         
         # Log query for debugging (without params for security)
-        logger.debug(f"Executing query: {query[:100]}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Executing query: %s...", query[:100])
         
-        start_time = time.time()
+        # Only time the query when the result will be logged
+        timed = logger.isEnabledFor(logging.INFO)
+        if timed:
+            start_time = time.perf_counter()
         
         try:
             # Execute with timeout
             results = self._execute_with_timeout(query, params)
             
             # Log execution time
-            execution_time = time.time() - start_time
-            logger.info(f"Query executed in {execution_time:.2f}s")
+            if timed:
+                logger.info("Query executed in %.2fs", time.perf_counter() - start_time)
             
             return results
             
         except Exception as e:
-            logger.error(f"Query execution failed: {str(e)}")
+            logger.error("Query execution failed: %s", e)
             raise ExecutionError(f"Query execution failed: {str(e)}")
     
+    def execute_native_query_columnar(self,
+                                      query: str,
+                                      params: Optional[Dict[str, Any]] = None) -> Dict[str, List[Any]]:
+        """
+        Execute a native query and return the results column-wise.
+        
+        Args:
+            query: Native query string with parameter placeholders
+            params: Parameter values for the query
+            
+        Returns:
+            Dictionary mapping column names to lists of values
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support columnar results"
+        )
+    
     def fetch_schema(self) -> Dict[str, Dict[str, str]]:
         """
         Fetch database schema with caching.
         
+        The cache is shared by all drivers in the process that point at
+        the same database. On a miss, one caller fetches the schema while
+        the others wait for its result.
+        
         Returns:
             Dictionary mapping table names to column info
         """
-        # Check cache
-        if self.schema_cache and (time.time() - self.schema_cache_time) < self.schema_cache_ttl:
-            logger.debug("Using cached schema")
-            return self.schema_cache
+        return self._load_schema(self._fetch_schema_impl)
+    
+    def _load_schema(self, fetch: Callable[[], Dict[str, Dict[str, str]]]) -> Dict[str, Dict[str, str]]:
+        """fetch_schema, with the fetch on a miss done by the given callable."""
+        # Lock-free fast path on this driver's own snapshot, unless another
+        # driver has since invalidated or replaced it in the shared cache
+        snapshot = self._schema_snapshot
+        entry = self._schema_entry
+        if (snapshot is not None and snapshot[1] > time.monotonic()
+                and entry is not None and entry['snapshot'] is snapshot):
+            return snapshot[0]
+        
+        key = self._schema_cache_key()
+        
+        while True:
+            with self._SHARED_LOCK:
+                entry = self._SHARED_SCHEMA.setdefault(
+                    key, {'snapshot': None, 'loading': None}
+                )
+                snapshot = entry['snapshot']
+                if snapshot is not None and snapshot[1] > time.monotonic():
+                    logger.debug("Using cached schema")
+                    self._schema_entry = entry
+                    self._schema_snapshot = snapshot
+                    return snapshot[0]
+                
+                loading = entry['loading']
+                if loading is None:
+                    loading = entry['loading'] = threading.Event()
+                    break
+            
+            # Another caller is fetching; wait for it and re-check
+            loading.wait()
         
         logger.info("Fetching database schema")
         
         try:
-            schema = self._fetch_schema_impl()
+            schema = self._intern_schema(fetch())
             
             # Cache the schema
-            self.schema_cache = schema
-            self.schema_cache_time = time.time()
+            self._publish_schema(key, schema)
             
             logger.info(f"Schema fetched: {len(schema)} tables")
-            return schema
             
         except Exception as e:
             logger.error(f"Failed to fetch schema: {str(e)}")
             raise SchemaError(f"Failed to fetch schema: {str(e)}")
+        finally:
+            with self._SHARED_LOCK:
+                entry['loading'] = None
+            loading.set()
+        
+        if self.config.get('schema_background_refresh', False):
+            self._start_schema_refresh(key)
+        
+        return schema
+    
+    def _schema_cache_key(self) -> Tuple:
+        """Key identifying this driver's database in the shared schema cache."""
+        return (
+            type(self).__name__,
+            self.config.get('host'),
+            self.config.get('port'),
+            self.config.get('database')
+        )
+    
+    @staticmethod
+    def _intern_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Intern table and column names in a fetched schema.
+        
+        Sanitized identifiers are interned too, so validation lookups
+        hit the identity fast path of string comparison.
+        """
+        return {
+            sys.intern(table): (
+                {sys.intern(column): info for column, info in columns.items()}
+                if isinstance(columns, dict) else columns
+            )
+            for table, columns in schema.items()
+        }
+    
+    def _publish_schema(self, key: Tuple, schema: Dict[str, Dict[str, str]]):
+        """Store a freshly fetched schema locally and in the shared cache."""
+        snapshot = (schema, time.monotonic() + self.schema_cache_ttl)
+        with self._SHARED_LOCK:
+            entry = self._SHARED_SCHEMA.setdefault(
+                key, {'snapshot': None, 'loading': None}
+            )
+            entry['snapshot'] = snapshot
+        self._schema_entry = entry
+        self._schema_snapshot = snapshot
+    
+    def _prewarm_schema(self):
+        """
+        Warm the schema cache in the background right after connecting.
+        
+        Called by drivers at the end of connect(); enabled with the
+        schema_prewarm option so the first query doesn't pay for the
+        schema fetch.
+        """
+        if self.config.get('schema_prewarm', False):
+            self._start_schema_refresh(self._schema_cache_key(), prewarm=True)
+    
+    def _start_schema_refresh(self, key: Tuple, prewarm: bool = False):
+        """Start the background schema refresher for this database, once per process."""
+        with self._SHARED_LOCK:
+            if key in self._SHARED_REFRESHERS:
+                return
+            self._SHARED_REFRESHERS.add(key)
+        
+        threading.Thread(
+            target=self._schema_refresh_loop,
+            args=(key, prewarm),
+            name=f"cognidb-schema-refresh-{key[-1]}",
+            daemon=True
+        ).start()
+    
+    def _schema_refresh_loop(self, key: Tuple, prewarm: bool = False):
+        """Re-fetch the schema shortly before it expires until disconnected."""
+        try:
+            if prewarm:
+                # Goes through the cache so concurrent first queries wait on this fetch
+                try:
+                    self._load_schema(self._fetch_schema_background)
+                    logger.debug("Schema pre-warmed")
+                except Exception as e:
+                    logger.warning(f"Schema pre-warm failed: {str(e)}")
+            
+            while self.connection is not None:
+                time.sleep(max(self.schema_cache_ttl - _SCHEMA_REFRESH_JITTER, 1))
+                if self.connection is None:
+                    break
+                try:
+                    self._publish_schema(key, self._intern_schema(self._fetch_schema_background()))
+                    logger.debug("Schema refreshed in background")
+                except Exception as e:
+                    logger.warning(f"Background schema refresh failed: {str(e)}")
+        finally:
+            with self._SHARED_LOCK:
+                self._SHARED_REFRESHERS.discard(key)
     
     def validate_table_name(self, table_name: str) -> bool:
         """Validate that a table name exists and is safe."""
-        # Sanitize the table name
-        try:
-            sanitized = self.sanitizer.sanitize_identifier(table_name)
-        except ValueError:
-            return False
-        
-        # Check if table exists in schema
-        schema = self.fetch_schema()
-        return sanitized in schema
+        return self.validate_columns(table_name, ())
     
     def validate_column_name(self, table_name: str, column_name: str) -> bool:
         """Validate that a column exists in the table."""
-        # Validate table first
-        if not self.validate_table_name(table_name):
-            return False
+        return self.validate_columns(table_name, (column_name,))
+    
+    def validate_columns(self, table_name: str, column_names: Iterable[str]) -> bool:
+        """
+        Validate that a table and all the given columns exist.
         
-        # Sanitize column name
+        The table name is sanitized and the schema looked up once,
+        however many columns are checked.
+        """
+        # Sanitize names
         try:
-            sanitized_column = self.sanitizer.sanitize_identifier(column_name)
+            sanitized_table = self.sanitizer.sanitize_identifier(table_name)
+            sanitized_columns = [
+                self.sanitizer.sanitize_identifier(column) for column in column_names
+            ]
         except ValueError:
             return False
         
-        # Check if column exists
-        schema = self.fetch_schema()
-        table_columns = schema.get(table_name, {})
-        return sanitized_column in table_columns
+        # Check table and columns against a single schema lookup
+        table_columns = self.fetch_schema().get(sanitized_table)
+        if table_columns is None:
+            return False
+        return all(column in table_columns for column in sanitized_columns)
     
     def get_connection_info(self) -> Dict[str, Any]:
         """Get connection information (for debugging, minus secrets)."""
@@ -163,10 +326,19 @@ class BaseDriver(DatabaseDriver):
         
         return info
     
+    @property
+    def schema_cache(self) -> Optional[Dict[str, Dict[str, str]]]:
+        """Last schema seen by this driver, if any."""
+        snapshot = self._schema_snapshot
+        return snapshot[0] if snapshot is not None else None
+    
     def invalidate_schema_cache(self):
-        """Invalidate the schema cache."""
-        self.schema_cache = None
-        self.schema_cache_time = 0
+        """Invalidate the schema cache, for every driver sharing it."""
+        with self._SHARED_LOCK:
+            entry = self._SHARED_SCHEMA.get(self._schema_cache_key())
+            if entry is not None:
+                entry['snapshot'] = None
+        self._schema_snapshot = None
         logger.info("Schema cache invalidated")
     
     def ping(self) -> bool:
@@ -184,6 +356,16 @@ class BaseDriver(DatabaseDriver):
         self.disconnect()
         self.connect()
     
+    def _fetch_schema_background(self) -> Dict[str, Dict[str, str]]:
+        """
+        Fetch the schema from the background refresher thread.
+        
+        The caller may be using self.connection at the same time, so
+        drivers whose _fetch_schema_impl reads it must override this to
+        fetch on a connection of the refresher's own.
+        """
+        return self._fetch_schema_impl()
+    
     # Abstract methods to be implemented by subclasses
     
     @abstractmethod
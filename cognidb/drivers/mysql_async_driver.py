@@ -0,0 +1,311 @@
+"""Asynchronous MySQL driver built on asyncmy."""
+
+import time
+import asyncio
+import logging
+import threading
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+from .base_driver import BaseDriver
+from .mysql_driver import MySQLDriver, _bind, _build_schema, _with_timeout_hint
+from ..core.exceptions import CogniDBError, ConnectionError, ExecutionError
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncMySQLDriver(BaseDriver):
+    """
+    MySQL driver that runs queries on an asyncio event loop.
+    
+    Features:
+    - asyncmy connection pool
+    - Independent queries issued concurrently (execute_many)
+    - uvloop event loop when installed
+    - Same synchronous API as MySQLDriver for existing callers
+    
+    The event loop runs in a daemon thread owned by the driver, so the
+    synchronous methods can be called from ordinary code. Async callers
+    await the *_async methods from their own loop; the work is handed
+    to the driver's loop, which owns the pool.
+    """
+    
+    _COLUMNS_QUERY = MySQLDriver._COLUMNS_QUERY
+    _INDEXES_QUERY = MySQLDriver._INDEXES_QUERY
+    
+    def __init__(self, config: Dict[str, Any]):
+        """Initialize async MySQL driver."""
+        super().__init__(config)
+        self.pool = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+    
+    def connect(self) -> None:
+        """Establish connection pool to MySQL database."""
+        try:
+            import asyncmy
+        except ImportError:
+            raise CogniDBError("asyncmy package required. Install with: pip install asyncmy")
+        
+        self._start_loop()
+        try:
+            self.pool = self._run(self._create_pool(asyncmy))
+        except Exception as e:
+            self._stop_loop()
+            logger.error(f"MySQL connection failed: {str(e)}")
+            raise ConnectionError(f"Failed to connect to MySQL: {str(e)}")
+        
+        # The pool stands in for the single connection of the sync drivers
+        self.connection = self.pool
+        self._connection_time = time.time()
+        
+        logger.info(f"Connected to MySQL database (async): {self.config['database']}")
+        
+        self._prewarm_schema()
+    
+    def disconnect(self) -> None:
+        """Close the connection pool and stop the event loop."""
+        if self.pool:
+            try:
+                self._run(self._close_pool())
+                logger.info("Disconnected from MySQL database")
+            except Exception as e:
+                logger.error(f"Error closing connection: {str(e)}")
+            finally:
+                self.pool = None
+                self.connection = None
+                self._connection_time = None
+        self._stop_loop()
+    
+    def execute_many(self,
+                     queries: Sequence[Tuple[str, Optional[Dict[str, Any]]]]) -> List[List[Dict[str, Any]]]:
+        """
+        Execute independent queries concurrently.
+        
+        Each query runs on its own pooled connection, so at most
+        pool_size queries are in flight at once.
+        
+        Args:
+            queries: Sequence of (query, params) pairs
+        
+        Returns:
+            Results for each query, in the order given
+        """
+        if not self.pool:
+            raise ConnectionError("Not connected to database")
+        return self._run(self._execute_many_async(queries))
+    
+    async def execute_many_async(self,
+                                 queries: Sequence[Tuple[str, Optional[Dict[str, Any]]]]) -> List[List[Dict[str, Any]]]:
+        """Execute independent queries concurrently, awaitable from any event loop."""
+        return await self._await_on_loop(self._execute_many_async(queries))
+    
+    async def execute_async(self,
+                            query: str,
+                            params: Optional[Dict[str, Any]] = None,
+                            timeout: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Execute a single query, awaitable from any event loop."""
+        return await self._await_on_loop(self._execute_async(query, params, timeout))
+    
+    async def _execute_many_async(self,
+                                  queries: Sequence[Tuple[str, Optional[Dict[str, Any]]]]) -> List[List[Dict[str, Any]]]:
+        """Execute independent queries concurrently on the driver's loop."""
+        return list(await asyncio.gather(
+            *(self._execute_async(query, params) for query, params in queries)
+        ))
+    
+    async def _execute_async(self,
+                             query: str,
+                             params: Optional[Dict[str, Any]] = None,
+                             timeout: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Execute a single query on a pooled connection; runs on the driver's loop."""
+        from asyncmy.cursors import SSDictCursor
+        from asyncmy.errors import Error
+        
+        if timeout is not None:
+            query = _with_timeout_hint(query, timeout * 1000)
+        
+        query, args = _bind(query, params)
+        
+        async with self.pool.acquire() as connection:
+            try:
+                # Unbuffered, so rows past the limit are never decoded; closing
+                # the cursor drains the rest before the connection is released
+                async with connection.cursor(SSDictCursor) as cursor:
+                    await cursor.execute(query, args)
+                    
+                    if not cursor.description:
+                        # For non-SELECT queries (committed by autocommit)
+                        return [{'affected_rows': cursor.rowcount}]
+                    
+                    # Read at most one row past the limit rather than the whole result
+                    max_results = self.config.get('max_result_size', 10000)
+                    results = await cursor.fetchmany(max_results + 1)
+                    
+                    # Apply result size limit
+                    if len(results) > max_results:
+                        logger.warning(f"Result truncated to {max_results} rows")
+                        results = results[:max_results]
+                    
+                    return list(results)
+            
+            except Error as e:
+                raise ExecutionError(f"Query execution failed: {str(e)}")
+    
+    def _execute_with_timeout(self,
+                              query: str,
+                              params: Optional[Dict[str, Any]] = None,
+                              timeout: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Execute query with timeout on the driver's event loop."""
+        if not self.pool:
+            raise ConnectionError("Not connected to database")
+        return self._run(self._execute_async(query, params, timeout))
+    
+    def _fetch_schema_impl(self) -> Dict[str, Dict[str, str]]:
+        """Fetch MySQL schema using INFORMATION_SCHEMA."""
+        return self._run(self._fetch_schema_async())
+    
+    async def _fetch_schema_async(self) -> Dict[str, Dict[str, str]]:
+        """Fetch columns and indexes concurrently and build the schema."""
+        params = (self.config['database'],)
+        column_rows, index_rows = await asyncio.gather(
+            self._fetch_rows(self._COLUMNS_QUERY, params),
+            self._fetch_rows(self._INDEXES_QUERY, params)
+        )
+        return _build_schema(column_rows, index_rows)
+    
+    async def _fetch_rows(self, query: str, params: tuple) -> List[tuple]:
+        """Run a metadata query on a pooled connection and return tuples."""
+        async with self.pool.acquire() as connection:
+            async with connection.cursor() as cursor:
+                await cursor.execute(query, params)
+                return list(await cursor.fetchall())
+    
+    async def _create_pool(self, asyncmy):
+        """Create the asyncmy connection pool."""
+        timeout = self.config.get('query_timeout', 30)
+        
+        pool_config = {
+            'minsize': 1,
+            'maxsize': self.config.get('pool_size', 5),
+            'host': self.config['host'],
+            'port': self.config.get('port', 3306),
+            'db': self.config['database'],
+            'user': self.config.get('username'),
+            'password': self.config.get('password'),
+            # No transactions span pooled queries, so none is left open on release
+            'autocommit': True,
+            'connect_timeout': self.config.get('connection_timeout', 10),
+            # Session defaults applied once per connection in a single statement
+            'init_command': (
+                f"SET SESSION MAX_EXECUTION_TIME={timeout * 1000}, "
+                "sql_mode='TRADITIONAL', time_zone='+00:00'"
+            )
+        }
+        
+        # SSL configuration
+        if self.config.get('ssl_enabled'):
+            import ssl
+            context = ssl.create_default_context(cafile=self.config.get('ssl_ca_cert'))
+            if self.config.get('ssl_client_cert'):
+                context.load_cert_chain(
+                    self.config['ssl_client_cert'],
+                    self.config.get('ssl_client_key')
+                )
+            pool_config['ssl'] = context
+        
+        return await asyncmy.create_pool(**pool_config)
+    
+    async def _close_pool(self):
+        """Close the pool and wait for its connections to finish."""
+        self.pool.close()
+        await self.pool.wait_closed()
+    
+    def _start_loop(self):
+        """Start the driver's event loop thread, using uvloop when available."""
+        if self._loop is not None:
+            return
+        
+        try:
+            import uvloop
+            loop = uvloop.new_event_loop()
+        except ImportError:
+            loop = asyncio.new_event_loop()
+        
+        self._loop = loop
+        self._loop_thread = threading.Thread(
+            target=loop.run_forever,
+            name="cognidb-mysql-async",
+            daemon=True
+        )
+        self._loop_thread.start()
+    
+    def _stop_loop(self):
+        """Stop the event loop thread."""
+        if self._loop is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join()
+        self._loop.close()
+        self._loop = None
+        self._loop_thread = None
+    
+    def _submit(self, coroutine):
+        """Schedule a coroutine on the driver's loop, returning a concurrent future."""
+        if self._loop is None:
+            coroutine.close()
+            raise ConnectionError("Not connected to database")
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+    
+    def _run(self, coroutine):
+        """Run a coroutine on the driver's loop and wait for its result."""
+        return self._submit(coroutine).result()
+    
+    async def _await_on_loop(self, coroutine):
+        """Await a coroutine on the driver's loop from whichever loop is running."""
+        if asyncio.get_running_loop() is self._loop:
+            return await coroutine
+        # The pool is bound to the driver's loop, so the work has to run there
+        return await asyncio.wrap_future(self._submit(coroutine))
+    
+    def _create_connection(self):
+        """The pool hands out connections per query."""
+        if not self.pool:
+            raise ConnectionError("Connection pool not initialized")
+        return self.pool
+    
+    def _close_connection(self):
+        """Connections are returned to the pool after each query."""
+        pass
+    
+    def _begin_transaction(self):
+        """Transactions are not supported across pooled async queries."""
+        raise ExecutionError("Transactions are not supported by the async MySQL driver")
+    
+    def _commit_transaction(self):
+        """Commit a transaction."""
+        raise ExecutionError("Transactions are not supported by the async MySQL driver")
+    
+    def _rollback_transaction(self):
+        """Rollback a transaction."""
+        pass
+    
+    def _get_driver_info(self) -> Dict[str, Any]:
+        """Get async MySQL-specific information."""
+        info = {
+            'pool_size': self.config.get('pool_size', 5),
+            'event_loop': type(self._loop).__module__ if self._loop else None
+        }
+        
+        if self.pool:
+            info['pool_free'] = self.pool.freesize
+        
+        return info
+    
+    @property
+    def supports_transactions(self) -> bool:
+        """Each query runs on its own pooled connection."""
+        return False
+    
+    @property
+    def supports_schemas(self) -> bool:
+        """MySQL supports schemas (databases)."""
+        return True
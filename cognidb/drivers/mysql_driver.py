@@ -1,15 +1,254 @@
 """Secure MySQL driver implementation."""
 
+import re
 import time
 import logging
-from typing import Dict, List, Any, Optional
+import threading
+from collections import OrderedDict, deque
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, Iterator, List, Any, Optional, Set, Tuple
 import mysql.connector
-from mysql.connector import pooling, Error
+from mysql.connector import pooling, errorcode, Error
+from mysql.connector.constants import FieldType
+from mysql.connector.errors import InterfaceError, OperationalError, PoolError
 from .base_driver import BaseDriver
-from ..core.exceptions import ConnectionError, ExecutionError
+from ..core.exceptions import CogniDBError, ConnectionError, ExecutionError
 
 logger = logging.getLogger(__name__)
 
+# Statements that accept a MAX_EXECUTION_TIME optimizer hint
+_SELECT_RE = re.compile(r'^\s*SELECT\b', re.IGNORECASE)
+_TIMEOUT_HINT_RE = re.compile(r'MAX_EXECUTION_TIME\s*\(', re.IGNORECASE)
+
+# Named pyformat placeholder, e.g. %(name)s
+_NAMED_PARAM_RE = re.compile(r'%\((\w+)\)s')
+
+# Client errors meaning the server connection is gone and may be re-established
+_CONNECTION_LOST_ERRNOS = frozenset({
+    errorcode.CR_SERVER_GONE_ERROR,
+    errorcode.CR_SERVER_LOST,
+    errorcode.CR_SERVER_LOST_EXTENDED
+})
+
+# Whether the C extension (_mysql_connector) is importable; if not, the
+# connector's pure-Python protocol implementation is used
+_HAVE_CEXT = getattr(mysql.connector, 'HAVE_CEXT', False)
+
+# MySQL field types with a direct Arrow equivalent
+_INTEGER_FIELD_TYPES = frozenset({
+    FieldType.TINY, FieldType.SHORT, FieldType.INT24, FieldType.LONG,
+    FieldType.LONGLONG, FieldType.YEAR
+})
+_FLOAT_FIELD_TYPES = frozenset({FieldType.FLOAT, FieldType.DOUBLE})
+
+# Rows requested per fetchmany() call when reading a result
+_FETCH_BATCH_SIZE = 512
+
+# Column type suffixes used when describing the schema
+NOT_NULL = " NOT NULL"
+PK = " PRIMARY KEY"
+
+
+def _format_type(data_type: str, is_nullable: str, column_key: str, extra: str) -> str:
+    """Build the schema description of a column."""
+    return "".join((
+        data_type,
+        NOT_NULL if is_nullable == 'NO' else "",
+        PK if column_key == 'PRI' else "",
+        f" {extra}" if extra else ""
+    ))
+
+
+def _build_schema(column_rows: List[tuple], index_rows: List[tuple]) -> Dict[str, Any]:
+    """Build the schema from the rows of the columns and indexes metadata queries."""
+    # Rows arrive ordered by table, so each table is one group
+    schema: Dict[str, Any] = {
+        table_name: {
+            column_name: _format_type(data_type, is_nullable, column_key, extra)
+            for _, column_name, data_type, is_nullable, column_key, _, extra in rows
+        }
+        for table_name, rows in groupby(column_rows, key=itemgetter(0))
+    }
+    
+    # Rows arrive ordered by index and column position, so each index is one group
+    for (table_name, index_name), group in groupby(index_rows, key=itemgetter(0, 1)):
+        if table_name in schema:
+            # Functional key parts (MySQL 8) have no COLUMN_NAME
+            columns = ','.join(row[2] for row in group if row[2] is not None)
+            schema.setdefault(f"{table_name}_indexes", []).append(f"{index_name} ({columns})")
+    
+    return schema
+
+
+def _is_connection_lost(error: Error) -> bool:
+    """Whether an error indicates a dropped connection rather than a bad query."""
+    return isinstance(error, InterfaceError) or error.errno in _CONNECTION_LOST_ERRNOS
+
+
+def _arrow_type(pa, type_code: int):
+    """Arrow type for a MySQL field type, or None to let pyarrow infer it."""
+    if type_code in _INTEGER_FIELD_TYPES:
+        return pa.int64()
+    if type_code in _FLOAT_FIELD_TYPES:
+        return pa.float64()
+    return None
+
+
+def _fetch_limited(cursor, max_results: int) -> Tuple[list, bool]:
+    """
+    Read at most max_results rows in batches.
+    
+    One row past the limit is read to detect truncation; returns the
+    rows and whether the result was truncated.
+    """
+    results = []
+    extend = results.extend
+    fetchmany = cursor.fetchmany
+    limit = max_results + 1
+    
+    while len(results) < limit:
+        batch = fetchmany(min(_FETCH_BATCH_SIZE, limit - len(results)))
+        if not batch:
+            break
+        extend(batch)
+    
+    if len(results) > max_results:
+        del results[max_results:]
+        return results, True
+    return results, False
+
+
+@lru_cache(maxsize=4096)
+def _prepare(query: str) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Rewrite named placeholders to positional ones.
+    
+    Returns the positional query and the parameter names in placeholder
+    order; queries without named placeholders are returned unchanged.
+    """
+    names = tuple(_NAMED_PARAM_RE.findall(query))
+    if not names:
+        return query, ()
+    return _NAMED_PARAM_RE.sub('%s', query), names
+
+
+def _bind(query: str, params: Optional[Dict[str, Any]]) -> Tuple[str, Optional[tuple]]:
+    """Resolve a query and its dict params into a positional query and arguments."""
+    if not params:
+        return query, None
+    positional_query, names = _prepare(query)
+    if names:
+        return positional_query, tuple(params[name] for name in names)
+    # Positional placeholders: params are taken in insertion order
+    return query, tuple(params.values())
+
+
+def _with_timeout_hint(query: str, timeout_ms: int) -> str:
+    """Inline a MAX_EXECUTION_TIME hint into a SELECT that has none."""
+    match = _SELECT_RE.match(query)
+    if not match or _TIMEOUT_HINT_RE.search(query):
+        return query
+    end = match.end()
+    return f"{query[:end]} /*+ MAX_EXECUTION_TIME({timeout_ms}) */{query[end:]}"
+
+
+class _LifoConnectionPool(pooling.MySQLConnectionPool):
+    """
+    Connection pool that hands out the most recently returned connection.
+    
+    Reusing hot connections keeps their session state warm and lets the
+    rest go idle, instead of rotating every connection through idle
+    timeouts. Connections are only pinged when they have been idle longer
+    than validation_interval seconds, and at most idle_max are kept.
+    """
+    
+    def __init__(self, idle_max: Optional[int] = None, validation_interval: float = 60, **kwargs):
+        self._stack: deque = deque()
+        self._stack_lock = threading.Lock()
+        self._open = 0
+        self._idle_max = idle_max or kwargs.get('pool_size', 5)
+        self._validation_interval = validation_interval
+        super().__init__(**kwargs)
+    
+    def add_connection(self, cnx=None):
+        """Return a connection to the pool, or pre-open one when cnx is None."""
+        if cnx is None:
+            with self._stack_lock:
+                if len(self._stack) >= self._idle_max:
+                    return
+                self._open += 1
+            try:
+                cnx = mysql.connector.connect(**self._cnx_config)
+            except Error:
+                with self._stack_lock:
+                    self._open -= 1
+                raise
+        
+        with self._stack_lock:
+            if len(self._stack) < self._idle_max:
+                self._stack.append((cnx, time.monotonic()))
+                return
+            self._open -= 1
+        
+        # Over the idle cap: close rather than keep it parked
+        try:
+            cnx.close()
+        except Error:
+            pass
+    
+    def get_connection(self):
+        """Get the most recently used connection, opening one if none are idle."""
+        with self._stack_lock:
+            if self._stack:
+                cnx, last_used = self._stack.pop()
+            elif self._open < self.pool_size:
+                cnx, last_used = None, None
+                self._open += 1
+            else:
+                raise PoolError("Failed getting connection; pool exhausted")
+        
+        try:
+            if cnx is None:
+                cnx = mysql.connector.connect(**self._cnx_config)
+            elif time.monotonic() - last_used > self._validation_interval:
+                # Only connections idle long enough to have been dropped are checked
+                cnx.ping(reconnect=True, attempts=1)
+        except Error:
+            with self._stack_lock:
+                self._open -= 1
+            raise
+        
+        return pooling.PooledMySQLConnection(self, cnx)
+    
+    def discard_connection(self, pooled):
+        """Close a checked-out connection for good instead of returning it, freeing its slot."""
+        cnx, pooled._cnx = pooled._cnx, None
+        if cnx is None:
+            return
+        with self._stack_lock:
+            self._open -= 1
+        try:
+            cnx.close()
+        except Error:
+            pass
+    
+    def _remove_connections(self) -> int:
+        """Close all idle connections."""
+        with self._stack_lock:
+            idle = [cnx for cnx, _ in self._stack]
+            self._stack.clear()
+            self._open -= len(idle)
+        
+        for cnx in idle:
+            try:
+                cnx.close()
+            except Error:
+                pass
+        return len(idle)
+
 
 class MySQLDriver(BaseDriver):
     """
@@ -20,17 +259,50 @@ class MySQLDriver(BaseDriver):
     - Parameterized queries only
     - SSL/TLS support
     - Query timeout enforcement
+    - Prepared statement caching
     - Automatic reconnection
     """
     
+    _COLUMNS_QUERY = """
+        SELECT 
+            TABLE_NAME,
+            COLUMN_NAME,
+            DATA_TYPE,
+            IS_NULLABLE,
+            COLUMN_KEY,
+            COLUMN_DEFAULT,
+            EXTRA
+        FROM INFORMATION_SCHEMA.COLUMNS
+        WHERE TABLE_SCHEMA = %s
+        ORDER BY TABLE_NAME, ORDINAL_POSITION
+        """
+    
+    # Long form, one row per index column; aggregated in Python so wide
+    # composite indexes are not cut off at group_concat_max_len
+    _INDEXES_QUERY = """
+        SELECT 
+            TABLE_NAME,
+            INDEX_NAME,
+            COLUMN_NAME
+        FROM INFORMATION_SCHEMA.STATISTICS
+        WHERE TABLE_SCHEMA = %s AND INDEX_NAME != 'PRIMARY'
+        ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX
+        """
+    
     def __init__(self, config: Dict[str, Any]):
         """Initialize MySQL driver."""
         super().__init__(config)
         self.pool = None
+        # (query, prepared cursor) for the current connection, keyed by query text (LRU)
+        self._statement_cache: OrderedDict = OrderedDict()
+        # Query texts the binary protocol refused (ER_UNSUPPORTED_PS); run on plain cursors
+        self._unpreparable: Set[str] = set()
         
     def connect(self) -> None:
         """Establish connection to MySQL database."""
         try:
+            timeout = self.config.get('query_timeout', 30)
+            
             # Prepare connection config
             pool_config = {
                 'pool_name': 'cognidb_mysql_pool',
@@ -42,9 +314,14 @@ class MySQLDriver(BaseDriver):
                 'password': self.config.get('password'),
                 'autocommit': False,
                 'raise_on_warnings': True,
-                'sql_mode': 'TRADITIONAL',
-                'time_zone': '+00:00',
-                'connect_timeout': self.config.get('connection_timeout', 10)
+                'connect_timeout': self.config.get('connection_timeout', 10),
+                # C extension decodes rows in C; fall back to pure Python without it
+                'use_pure': not (_HAVE_CEXT and self.config.get('use_c_extension', True)),
+                # Session defaults applied once per connection in a single statement
+                'init_command': (
+                    f"SET SESSION MAX_EXECUTION_TIME={timeout * 1000}, "
+                    "sql_mode='TRADITIONAL', time_zone='+00:00'"
+                )
             }
             
             # SSL configuration
@@ -62,7 +339,11 @@ class MySQLDriver(BaseDriver):
                 pool_config.update(ssl_config)
             
             # Create connection pool
-            self.pool = pooling.MySQLConnectionPool(**pool_config)
+            self.pool = _LifoConnectionPool(
+                idle_max=self.config.get('pool_idle_max'),
+                validation_interval=self.config.get('pool_validation_interval', 60),
+                **pool_config
+            )
             
             # Test connection
             self.connection = self.pool.get_connection()
@@ -70,6 +351,8 @@ class MySQLDriver(BaseDriver):
             
             logger.info(f"Connected to MySQL database: {self.config['database']}")
             
+            self._prewarm_schema()
+            
         except Error as e:
             logger.error(f"MySQL connection failed: {str(e)}")
             raise ConnectionError(f"Failed to connect to MySQL: {str(e)}")
@@ -78,6 +361,7 @@ class MySQLDriver(BaseDriver):
         """Close the database connection."""
         if self.connection:
             try:
+                self._clear_statement_cache()
                 self.connection.close()
                 logger.info("Disconnected from MySQL database")
             except Error as e:
@@ -99,121 +383,348 @@ class MySQLDriver(BaseDriver):
     
     def _execute_with_timeout(self, 
                             query: str, 
-                            params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-        """Execute query with timeout."""
-        cursor = None
+                            params: Optional[Dict[str, Any]] = None,
+                            timeout: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Execute query with timeout.
+        
+        The configured query_timeout is a session default set by the pool's
+        init_command; a per-query timeout (seconds) is applied as an
+        optimizer hint instead.
+        """
+        # Get connection from pool if needed
+        if not self.connection:
+            self.connection = self._create_connection()
+        
+        if timeout is not None:
+            query = _with_timeout_hint(query, timeout * 1000)
+        
+        query, args = _bind(query, params)
         
         try:
-            # Get connection from pool if needed
-            if not self.connection or not self.connection.is_connected():
+            try:
+                return self._execute_statement(query, args)
+            except (OperationalError, InterfaceError) as e:
+                if not _is_connection_lost(e):
+                    raise
+                # Execute optimistically; only reconnect once the link is known dead
+                logger.warning(f"MySQL connection lost, reconnecting: {str(e)}")
+                self._clear_statement_cache()
+                # Release the dead connection's pool slot before taking another
+                dead, self.connection = self.connection, None
+                self.pool.discard_connection(dead)
                 self.connection = self._create_connection()
+                return self._execute_statement(query, args)
             
-            # Set query timeout
-            timeout = self.config.get('query_timeout', 30)
-            self.connection.cmd_query(f"SET SESSION MAX_EXECUTION_TIME={timeout * 1000}")
+        except Error as e:
+            if self.connection:
+                try:
+                    self.connection.rollback()
+                except Error:
+                    pass
+            raise ExecutionError(f"Query execution failed: {str(e)}")
+    
+    def _execute_statement(self,
+                           query: str,
+                           args: Optional[tuple]) -> List[Dict[str, Any]]:
+        """Run a single positional statement on the current connection."""
+        if query in self._unpreparable:
+            return self._execute_unprepared(query, args)
+        
+        # A plain cursor unescapes %% while interpolating args; the binary
+        # protocol sends the text as-is, so unescape it here to match
+        prepared_query = query.replace('%%', '%') if args else query
+        
+        # Reuse the server-side prepared statement for this query text; the
+        # connector only skips re-preparing when given the very same string object
+        prepared_query, cursor = self._get_prepared_cursor(prepared_query)
+        
+        try:
+            # Execute query with parameters
+            if args:
+                cursor.execute(prepared_query, args)
+            else:
+                cursor.execute(prepared_query)
             
-            # Create cursor
-            cursor = self.connection.cursor(dictionary=True, buffered=True)
+            results, truncated = self._collect_results(cursor)
+        except Error as e:
+            self._discard_prepared_cursor(prepared_query)
+            if e.errno != errorcode.ER_UNSUPPORTED_PS:
+                raise
+            # Statements the binary protocol can't prepare (e.g. some SHOW
+            # forms) run on a plain cursor from now on
+            if len(self._unpreparable) > 4 * self.config.get('statement_cache_size', 256):
+                self._unpreparable.clear()
+            self._unpreparable.add(query)
+            return self._execute_unprepared(query, args)
+        
+        if truncated:
+            # The remainder was drained, so the cursor can now be closed
+            self._discard_prepared_cursor(prepared_query)
+        return results
+    
+    def _execute_unprepared(self,
+                            query: str,
+                            args: Optional[tuple]) -> List[Dict[str, Any]]:
+        """Run a positional statement on a plain (client-side interpolating) cursor."""
+        cursor = self.connection.cursor(dictionary=True)
+        try:
+            if args:
+                cursor.execute(query, args)
+            else:
+                cursor.execute(query)
+            return self._collect_results(cursor)[0]
+        finally:
+            cursor.close()
+    
+    def _collect_results(self, cursor) -> Tuple[List[Dict[str, Any]], bool]:
+        """Read an executed statement's result; returns the rows and whether they were truncated."""
+        if not cursor.description:
+            # For non-SELECT queries
+            self.connection.commit()
+            return [{'affected_rows': cursor.rowcount}], False
+        
+        # Read at most one row past the limit rather than the whole result
+        max_results = self.config.get('max_result_size', 10000)
+        results, truncated = _fetch_limited(cursor, max_results)
+        
+        # Apply result size limit
+        if truncated:
+            logger.warning(f"Result truncated to {max_results} rows")
+            # Drain the unread remainder; a prepared cursor can't be closed
+            # (deallocating its statement) while rows are pending
+            self.connection.consume_results()
+        
+        return results, truncated
+    
+    def execute_native_query_columnar(self,
+                                      query: str,
+                                      params: Optional[Dict[str, Any]] = None) -> Dict[str, List[Any]]:
+        """
+        Execute a native query and return the results column-wise.
+        
+        Rows are read as tuples and transposed, so no per-row dictionary
+        is built.
+        
+        Args:
+            query: Native query string with parameter placeholders
+            params: Parameter values for the query
             
-            # Execute query with parameters
-            if params:
-                # Convert dict params to list for MySQL
-                cursor.execute(query, list(params.values()))
+        Returns:
+            Dictionary mapping column names to lists of values
+        """
+        description, columns = self._fetch_columns(query, params)
+        return {column[0]: values for column, values in zip(description, columns)}
+    
+    def execute_native_query_arrow(self,
+                                   query: str,
+                                   params: Optional[Dict[str, Any]] = None):
+        """
+        Execute a native query and return the results as a pyarrow.Table.
+        
+        Column types are derived from the MySQL field types where they map
+        directly; other columns are inferred by pyarrow.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise CogniDBError("pyarrow package required. Install with: pip install pyarrow")
+        
+        description, columns = self._fetch_columns(query, params)
+        arrays = [
+            pa.array(values, type=_arrow_type(pa, column[1]))
+            for column, values in zip(description, columns)
+        ]
+        return pa.Table.from_arrays(arrays, names=[column[0] for column in description])
+    
+    def _fetch_columns(self,
+                       query: str,
+                       params: Optional[Dict[str, Any]]) -> Tuple[List[tuple], List[List[Any]]]:
+        """Run a query on a tuple cursor and return (description, column lists)."""
+        if not self.connection:
+            raise ConnectionError("Not connected to database")
+        
+        cursor = None
+        try:
+            cursor = self.connection.cursor()
+            query, args = _bind(query, params)
+            if args:
+                cursor.execute(query, args)
             else:
                 cursor.execute(query)
             
-            # Fetch results
-            if cursor.description:
-                results = cursor.fetchall()
-                
-                # Apply result size limit
-                max_results = self.config.get('max_result_size', 10000)
-                if len(results) > max_results:
-                    logger.warning(f"Result truncated from {len(results)} to {max_results} rows")
-                    results = results[:max_results]
-                
-                return results
+            if not cursor.description:
+                raise ExecutionError("Query did not return a result set")
+            description = cursor.description
+            
+            # Apply result size limit
+            max_results = self.config.get('max_result_size', 10000)
+            rows, truncated = _fetch_limited(cursor, max_results)
+            if truncated:
+                logger.warning(f"Result truncated to {max_results} rows")
+                self.connection.consume_results()
+            
+            # Transpose rows into columns
+            if rows:
+                columns = [list(values) for values in zip(*rows)]
             else:
-                # For non-SELECT queries
-                self.connection.commit()
-                return [{'affected_rows': cursor.rowcount}]
+                columns = [[] for _ in description]
+            
+            return description, columns
             
         except Error as e:
-            if self.connection:
-                self.connection.rollback()
             raise ExecutionError(f"Query execution failed: {str(e)}")
         finally:
             if cursor:
                 cursor.close()
     
-    def _fetch_schema_impl(self) -> Dict[str, Dict[str, str]]:
-        """Fetch MySQL schema using INFORMATION_SCHEMA."""
-        query = """
-        SELECT 
-            TABLE_NAME,
-            COLUMN_NAME,
-            DATA_TYPE,
-            IS_NULLABLE,
-            COLUMN_KEY,
-            COLUMN_DEFAULT,
-            EXTRA
-        FROM INFORMATION_SCHEMA.COLUMNS
-        WHERE TABLE_SCHEMA = %s
-        ORDER BY TABLE_NAME, ORDINAL_POSITION
+    def iter_results(self,
+                     query: str,
+                     params: Optional[Dict[str, Any]] = None,
+                     batch_size: int = 1000,
+                     timeout: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
         """
+        Stream query results in batches without materializing them.
         
-        cursor = None
+        Args:
+            query: Native query string with parameter placeholders
+            params: Parameter values for the query
+            batch_size: Number of rows per yielded batch
+            timeout: Per-query timeout in seconds (defaults to the session setting)
+            
+        Yields:
+            Lists of result rows as dictionaries
+        """
+        if not self.connection:
+            raise ConnectionError("Not connected to database")
+        
+        if timeout is not None:
+            query = _with_timeout_hint(query, timeout * 1000)
+        
+        # Dedicated unbuffered cursor so cached statements stay usable meanwhile
+        cursor = self.connection.cursor(dictionary=True)
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            cursor.execute(query, (self.config['database'],))
+            query, args = _bind(query, params)
+            if args:
+                cursor.execute(query, args)
+            else:
+                cursor.execute(query)
             
-            schema = {}
-            for row in cursor:
-                table_name = row['TABLE_NAME']
-                if table_name not in schema:
-                    schema[table_name] = {}
+            while True:
+                batch = cursor.fetchmany(batch_size)
+                if not batch:
+                    break
+                yield batch
                 
-                # Build column info
-                col_type = row['DATA_TYPE']
-                if row['IS_NULLABLE'] == 'NO':
-                    col_type += ' NOT NULL'
-                if row['COLUMN_KEY'] == 'PRI':
-                    col_type += ' PRIMARY KEY'
-                if row['EXTRA']:
-                    col_type += f" {row['EXTRA']}"
-                
-                schema[table_name][row['COLUMN_NAME']] = col_type
-            
-            # Fetch indexes
-            self._fetch_indexes(schema, cursor)
-            
-            return schema
-            
+        except Error as e:
+            raise ExecutionError(f"Query execution failed: {str(e)}")
         finally:
-            if cursor:
+            # Discard rows left unread if the consumer stopped early
+            if self.connection.unread_result:
+                self.connection.consume_results()
+            cursor.close()
+    
+    def _get_prepared_cursor(self, query: str) -> Tuple[str, Any]:
+        """
+        Get the cached (query, prepared cursor) pair, preparing it on first use.
+        
+        The returned query is the string object the cursor was first
+        executed with; pass that one to execute().
+        """
+        entry = self._statement_cache.get(query)
+        if entry is not None:
+            self._statement_cache.move_to_end(query)
+            return entry
+        
+        entry = (query, self.connection.cursor(prepared=True, dictionary=True))
+        self._statement_cache[query] = entry
+        
+        # Evict the least recently used statement
+        if len(self._statement_cache) > self.config.get('statement_cache_size', 256):
+            _, (_, evicted) = self._statement_cache.popitem(last=False)
+            try:
+                evicted.close()
+            except Error:
+                pass
+        
+        return entry
+    
+    def _discard_prepared_cursor(self, query: str):
+        """Drop and close a cached prepared cursor."""
+        entry = self._statement_cache.pop(query, None)
+        if entry is not None:
+            try:
+                entry[1].close()
+            except Error:
+                pass
+    
+    def _clear_statement_cache(self):
+        """Close all prepared cursors of the current connection."""
+        while self._statement_cache:
+            _, (_, cursor) = self._statement_cache.popitem()
+            try:
                 cursor.close()
+            except Error:
+                pass
     
-    def _fetch_indexes(self, schema: Dict[str, Dict[str, str]], cursor):
-        """Fetch index information."""
-        query = """
-        SELECT 
-            TABLE_NAME,
-            INDEX_NAME,
-            GROUP_CONCAT(COLUMN_NAME ORDER BY SEQ_IN_INDEX) as COLUMNS
-        FROM INFORMATION_SCHEMA.STATISTICS
-        WHERE TABLE_SCHEMA = %s AND INDEX_NAME != 'PRIMARY'
-        GROUP BY TABLE_NAME, INDEX_NAME
+    def _fetch_schema_impl(self, connection=None) -> Dict[str, Dict[str, str]]:
         """
+        Fetch MySQL schema using INFORMATION_SCHEMA.
         
-        cursor.execute(query, (self.config['database'],))
+        Without spare pooled connections, both queries run on the given
+        connection (self.connection by default).
+        """
+        params = (self.config['database'],)
+        
+        column_rows = index_rows = None
+        if self.config.get('schema_parallel_fetch', True) and self.pool:
+            try:
+                # Columns and indexes are independent; run both round-trips at once
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    columns_future = executor.submit(self._fetch_rows_pooled, self._COLUMNS_QUERY, params)
+                    indexes_future = executor.submit(self._fetch_rows_pooled, self._INDEXES_QUERY, params)
+                    column_rows = columns_future.result()
+                    index_rows = indexes_future.result()
+            except PoolError as e:
+                logger.debug(f"Parallel schema fetch unavailable, falling back: {str(e)}")
         
-        for row in cursor:
-            table_name = row['TABLE_NAME']
-            if table_name in schema:
-                index_key = f"{table_name}_indexes"
-                if index_key not in schema:
-                    schema[index_key] = []
-                schema[index_key].append(f"{row['INDEX_NAME']} ({row['COLUMNS']})")
+        if column_rows is None or index_rows is None:
+            connection = connection or self.connection
+            column_rows = self._fetch_rows(connection, self._COLUMNS_QUERY, params)
+            index_rows = self._fetch_rows(connection, self._INDEXES_QUERY, params)
+        
+        return _build_schema(column_rows, index_rows)
+    
+    def _fetch_schema_background(self) -> Dict[str, Dict[str, str]]:
+        """Fetch the schema on a pooled connection, never the shared self.connection."""
+        pool = self.pool
+        if not pool:
+            raise ConnectionError("Not connected to database")
+        
+        connection = pool.get_connection()
+        try:
+            return self._fetch_schema_impl(connection)
+        finally:
+            connection.close()
+    
+    @staticmethod
+    def _fetch_rows(connection, query: str, params: tuple) -> List[tuple]:
+        """Run a metadata query and return all rows as tuples."""
+        # Tuple cursor: avoids building a dict per row
+        cursor = connection.cursor()
+        try:
+            cursor.execute(query, params)
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+    
+    def _fetch_rows_pooled(self, query: str, params: tuple) -> List[tuple]:
+        """Run a metadata query on its own pooled connection."""
+        connection = self.pool.get_connection()
+        try:
+            return self._fetch_rows(connection, query, params)
+        finally:
+            connection.close()
     
     def _begin_transaction(self):
         """Begin a transaction."""
@@ -1,16 +1,367 @@
 """Secure PostgreSQL driver implementation."""
 
+import re
+import json
+import math
 import time
+import datetime
+import queue
+import hashlib
 import logging
-from typing import Dict, List, Any, Optional
+import itertools
+import threading
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Any, Mapping, Optional, Sequence, Set, Tuple
 import psycopg2
 from psycopg2 import pool, sql, extras, OperationalError, DatabaseError
-from psycopg2.extensions import ISOLATION_LEVEL_READ_COMMITTED
+from psycopg2.extensions import (
+    ISOLATION_LEVEL_READ_COMMITTED, TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_UNKNOWN
+)
 from .base_driver import BaseDriver
 from ..core.exceptions import ConnectionError, ExecutionError
 
 logger = logging.getLogger(__name__)
 
+# INSERT whose VALUES list is a single %s, the form execute_values expands
+_INSERT_VALUES_RE = re.compile(r'^\s*INSERT\b.*\bVALUES\s+%s\s*(?:RETURNING\b.*)?$',
+                               re.IGNORECASE | re.DOTALL)
+
+# psycopg2 placeholders: %(name)s, %s, or an escaped %%
+_PLACEHOLDER_RE = re.compile(r'%\((\w+)\)s|%s|%%')
+
+# Type names accepted in PREPARE ... (types), e.g. integer, varchar(64), numeric(10,2), text[]
+_PARAM_TYPE_RE = re.compile(r'^[A-Za-z_][\w ]*(?:\(\d+(?:,\s*\d+)?\))?(?:\[\])?$')
+
+# Statements PREPARE accepts; anything else (DDL, EXPLAIN, SET, ...) runs unprepared
+_PREPARABLE_RE = re.compile(r'^\s*(?:SELECT|INSERT|UPDATE|DELETE|WITH|VALUES)\b', re.IGNORECASE)
+
+# Queries that can take an appended LIMIT, and clauses that rule it out
+_ROW_QUERY_RE = re.compile(r'^\s*(?:SELECT|VALUES)\b', re.IGNORECASE)
+_ROW_LIMIT_SKIP_RE = re.compile(r'\b(?:LIMIT|OFFSET|FETCH|INTO|FOR\s+(?:NO\s+KEY\s+)?(?:UPDATE|SHARE|KEY\s+SHARE))\b',
+                                re.IGNORECASE)
+
+# Characters escaped in COPY text format values
+_COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+_PLAN_CACHE_MODES = frozenset({'auto', 'force_custom_plan', 'force_generic_plan'})
+
+# Column type suffixes used when describing the schema
+NOT_NULL = " NOT NULL"
+PK = " PRIMARY KEY"
+DEFAULT = " DEFAULT"
+
+
+def _format_type(row: Dict[str, Any]) -> str:
+    """Build the schema description of a column from an information_schema row."""
+    precision = row['numeric_precision']
+    scale = row['numeric_scale']
+    
+    if row['character_maximum_length']:
+        size = f"({row['character_maximum_length']})"
+    elif precision:
+        size = f"({precision},{scale})" if scale else f"({precision})"
+    else:
+        size = ""
+    
+    return "".join((
+        row['data_type'],
+        size,
+        NOT_NULL if row['is_nullable'] == 'NO' else "",
+        PK if row['constraint_type'] == 'PRIMARY KEY' else "",
+        DEFAULT if row['column_default'] else ""
+    ))
+
+
+@lru_cache(maxsize=1024)
+def _to_positional(query: str) -> Tuple[str, Tuple[Optional[str], ...]]:
+    """
+    Rewrite psycopg2 placeholders to PREPARE-style $1..$n.
+    
+    Returns the rewritten query and, per $n, the parameter name (None
+    for positional %s). A repeated %(name)s reuses its $n.
+    """
+    names: List[Optional[str]] = []
+    
+    def replace(match):
+        token = match.group(0)
+        if token == '%%':
+            return '%'
+        name = match.group(1)
+        if name is not None and name in names:
+            return f"${names.index(name) + 1}"
+        names.append(name)
+        return f"${len(names)}"
+    
+    return _PLACEHOLDER_RE.sub(replace, query), tuple(names)
+
+
+def _with_row_limit(query: str, limit: int) -> str:
+    """
+    Append a LIMIT to a SELECT that has no row-limiting clause of its own.
+    
+    The check is conservative: a LIMIT/OFFSET/FETCH/FOR UPDATE anywhere
+    in the text (including subqueries) leaves the query unchanged, as
+    does a semicolon anywhere but at the very end (e.g. one followed by
+    a comment), where the LIMIT would become a statement of its own.
+    """
+    if not _ROW_QUERY_RE.match(query) or _ROW_LIMIT_SKIP_RE.search(query):
+        return query
+    body = query.rstrip().rstrip(';')
+    if ';' in body:
+        return query
+    # On its own line so a trailing -- comment can't swallow it
+    return f"{body}\nLIMIT {limit}"
+
+
+def _bind_args(names: Tuple[Optional[str], ...], params: Any) -> tuple:
+    """Order params (a mapping or a sequence) to match a statement's $1..$n."""
+    if not params:
+        return ()
+    if not isinstance(params, Mapping):
+        return tuple(params)
+    if names and names[0] is not None:
+        return tuple(params[name] for name in names)
+    # Positional placeholders: params are taken in insertion order
+    return tuple(params.values())
+
+
+@contextmanager
+def _read_transaction(connection):
+    """
+    Run reads in a transaction of their own, or in the caller's if one is open.
+    
+    ``with connection`` commits on exit, which would also commit whatever
+    the caller has done so far in an open transaction.
+    """
+    if connection.info.transaction_status != TRANSACTION_STATUS_IDLE:
+        yield
+        return
+    with connection:
+        yield
+
+
+def _copy_value(value: Any) -> str:
+    """
+    Render a non-NULL value in PostgreSQL's text input format, before COPY escaping.
+    
+    bytes become bytea hex (\\x...), dicts and lists JSON; anything not
+    handled explicitly falls back to str().
+    """
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return '\\x' + bytes(value).hex()
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, datetime.timedelta):
+        return f"{value.days} days {value.seconds} seconds {value.microseconds} microseconds"
+    if isinstance(value, float):
+        if math.isnan(value):
+            return 'NaN'
+        if math.isinf(value):
+            return 'Infinity' if value > 0 else '-Infinity'
+        return repr(value)
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return str(value)
+
+
+def _copy_line(row: Sequence[Any]) -> str:
+    """Render a row as one line of COPY text format (NULL is \\N)."""
+    return "\t".join(
+        "\\N" if value is None else _copy_value(value).translate(_COPY_ESCAPES)
+        for value in row
+    ) + "\n"
+
+
+class _CopyStream:
+    """
+    File-like reader that renders rows as COPY text on demand.
+    
+    copy_expert pulls fixed-size chunks through read(), so rows are
+    formatted as the server consumes them and the whole load is never
+    held in memory.
+    """
+    
+    def __init__(self, rows: Iterable[Sequence[Any]], batch_rows: int = 1000):
+        self._rows = iter(rows)
+        self._batch_rows = batch_rows
+        self._buffer = ""
+        self.row_count = 0
+    
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self._buffer) < size:
+            batch = list(itertools.islice(self._rows, self._batch_rows))
+            if not batch:
+                break
+            self.row_count += len(batch)
+            self._buffer += "".join(map(_copy_line, batch))
+        
+        if size < 0:
+            data, self._buffer = self._buffer, ""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+class _LockFreeConnectionPool:
+    """
+    psycopg2 connection pool without a pool-wide lock.
+    
+    Idle connections and the remaining connection allowance live in
+    queue.SimpleQueue instances, whose get/put are atomic in C, so
+    checkout and return never serialize on a Python-level lock the way
+    ThreadedConnectionPool does. Connections idle for longer than
+    idle_timeout seconds are closed instead of reused.
+    
+    Checkout times and exhaustions are recorded for stats(). When the
+    pool runs out of connections it grows by grow_step, up to
+    max_size, before refusing checkouts.
+    """
+    
+    # Recent checkout times kept for the wait percentiles in stats()
+    _WAIT_SAMPLES = 1024
+    
+    def __init__(self, minconn: int, maxconn: int, idle_timeout: float = 300,
+                 max_size: Optional[int] = None, grow_step: int = 1, **conn_params):
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.max_size = max(max_size or maxconn, maxconn)
+        self.grow_step = max(grow_step, 1)
+        self.idle_timeout = idle_timeout
+        self._conn_params = conn_params
+        # deque.append is atomic, so recording a sample needs no lock
+        self._waits: deque = deque(maxlen=self._WAIT_SAMPLES)
+        self.saturations = 0
+        # Only taken on the rare grow path, never on checkout or return
+        self._grow_lock = threading.Lock()
+        self._idle: queue.SimpleQueue = queue.SimpleQueue()
+        # One token per connection that may still be opened
+        self._permits: queue.SimpleQueue = queue.SimpleQueue()
+        for _ in range(maxconn):
+            self._permits.put(None)
+        # Every open connection, idle or checked out, by id; dict get/set/pop are atomic
+        self._connections: Dict[int, Any] = {}
+        self.closed = False
+        
+        for _ in range(minconn):
+            self.putconn(self._open())
+    
+    def getconn(self):
+        """Check out an idle connection, opening a new one if none are available."""
+        if self.closed:
+            raise pool.PoolError("connection pool is closed")
+        
+        start = time.monotonic()
+        while True:
+            try:
+                conn, last_used = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._open()
+                break
+            if conn.closed or start - last_used > self.idle_timeout:
+                self._discard(conn)
+                continue
+            break
+        
+        self._waits.append((time.monotonic() - start) * 1000)
+        return conn
+    
+    def putconn(self, conn, close: bool = False):
+        """Return a connection to the pool."""
+        if close or self.closed or conn.closed:
+            self._discard(conn)
+            return
+        
+        # Never hand out a connection that is mid-transaction
+        status = conn.info.transaction_status
+        if status == TRANSACTION_STATUS_UNKNOWN:
+            self._discard(conn)
+            return
+        if status != TRANSACTION_STATUS_IDLE:
+            conn.rollback()
+        
+        self._idle.put((conn, time.monotonic()))
+    
+    def closeall(self):
+        """Close all connections, checked out or idle, and refuse further checkouts."""
+        self.closed = True
+        while True:
+            try:
+                conn, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
+        
+        # Checked-out connections free their slot when returned with putconn
+        for conn in list(self._connections.values()):
+            try:
+                conn.close()
+            except Exception:
+                pass
+    
+    def stats(self) -> Dict[str, Any]:
+        """Pool usage and saturation figures for tuning pool_size."""
+        idle = self._idle.qsize()
+        waits = sorted(self._waits)
+        return {
+            'in_use': max(self.maxconn - self._permits.qsize() - idle, 0),
+            'idle': idle,
+            'max_connections': self.maxconn,
+            'max_size': self.max_size,
+            'p99_wait_ms': waits[int(len(waits) * 0.99)] if waits else 0.0,
+            'saturations': self.saturations
+        }
+    
+    def _open(self):
+        """Open a new connection if the pool has room, growing it when allowed."""
+        try:
+            self._permits.get_nowait()
+        except queue.Empty:
+            self.saturations += 1
+            if not self._grow():
+                raise pool.PoolError("connection pool exhausted")
+            try:
+                self._permits.get_nowait()
+            except queue.Empty:
+                raise pool.PoolError("connection pool exhausted")
+        try:
+            conn = psycopg2.connect(**self._conn_params)
+        except Exception:
+            self._permits.put(None)
+            raise
+        self._connections[id(conn)] = conn
+        return conn
+    
+    def _grow(self) -> bool:
+        """Raise maxconn by grow_step up to max_size; False if already at the ceiling."""
+        with self._grow_lock:
+            step = min(self.grow_step, self.max_size - self.maxconn)
+            if step <= 0:
+                logger.warning(
+                    "PostgreSQL connection pool exhausted at its ceiling of %d connections",
+                    self.max_size
+                )
+                return False
+            self.maxconn += step
+            for _ in range(step):
+                self._permits.put(None)
+        logger.info("PostgreSQL connection pool grown to %d connections", self.maxconn)
+        return True
+    
+    def _discard(self, conn):
+        """Close a connection and free its slot."""
+        self._connections.pop(id(conn), None)
+        try:
+            conn.close()
+        except Exception:
+            pass
+        self._permits.put(None)
+
 
 class PostgreSQLDriver(BaseDriver):
     """
@@ -29,7 +380,17 @@ class PostgreSQLDriver(BaseDriver):
         """Initialize PostgreSQL driver."""
         super().__init__(config)
         self.pool = None
-        self._prepared_statements = {}
+        # Server-side prepared statements: name -> (query, parameter names), in LRU order
+        self._prepared_statements: OrderedDict = OrderedDict()
+        # Executions seen per auto-prepare candidate, keyed by statement name
+        self._query_counts: Dict[str, int] = {}
+        # Auto-prepare candidates the server refused to PREPARE or EXECUTE
+        self._never_prepare: Set[str] = set()
+        # libpq parameters, reused for the psycopg 3 pipeline connection
+        self._conn_params: Dict[str, Any] = {}
+        self._pipeline_connection = None
+        # Unique names for server-side streaming cursors
+        self._cursor_ids = itertools.count()
         
     def connect(self) -> None:
         """Establish connection to PostgreSQL database."""
@@ -43,9 +404,22 @@ class PostgreSQLDriver(BaseDriver):
                 'password': self.config.get('password'),
                 'connect_timeout': self.config.get('connection_timeout', 10),
                 'application_name': 'CogniDB',
-                'options': f"-c statement_timeout={self.config.get('query_timeout', 30)}s"
+                # Session settings applied at connection startup, with no extra round trips
+                'options': (
+                    f"-c statement_timeout={self.config.get('query_timeout', 30)}s "
+                    "-c timezone=UTC "
+                    "-c lock_timeout=5s "
+                    "-c idle_in_transaction_session_timeout=60s"
+                )
             }
             
+            # Generic vs custom plan choice for prepared statements
+            plan_cache_mode = self.config.get('plan_cache_mode')
+            if plan_cache_mode:
+                if plan_cache_mode not in _PLAN_CACHE_MODES:
+                    raise ConnectionError(f"Invalid plan_cache_mode: {plan_cache_mode}")
+                conn_params['options'] += f" -c plan_cache_mode={plan_cache_mode}"
+            
             # SSL configuration
             if self.config.get('ssl_enabled', True):
                 conn_params['sslmode'] = 'require'
@@ -57,9 +431,13 @@ class PostgreSQLDriver(BaseDriver):
                     conn_params['sslkey'] = self.config['ssl_client_key']
             
             # Create connection pool
-            self.pool = psycopg2.pool.ThreadedConnectionPool(
+            self._conn_params = conn_params
+            self.pool = _LockFreeConnectionPool(
                 minconn=1,
                 maxconn=self.config.get('pool_size', 5),
+                idle_timeout=self.config.get('pool_idle_timeout', 300),
+                max_size=self.config.get('pool_max_size'),
+                grow_step=self.config.get('pool_grow_step', 1),
                 **conn_params
             )
             
@@ -68,16 +446,10 @@ class PostgreSQLDriver(BaseDriver):
             self.connection.set_isolation_level(ISOLATION_LEVEL_READ_COMMITTED)
             self._connection_time = time.time()
             
-            # Set additional session parameters
-            with self.connection.cursor() as cursor:
-                cursor.execute("SET TIME ZONE 'UTC'")
-                cursor.execute("SET lock_timeout = '5s'")
-                cursor.execute("SET idle_in_transaction_session_timeout = '60s'")
-            
-            self.connection.commit()
-            
             logger.info(f"Connected to PostgreSQL database: {self.config['database']}")
             
+            self._prewarm_schema()
+            
         except (OperationalError, DatabaseError) as e:
             logger.error(f"PostgreSQL connection failed: {str(e)}")
             raise ConnectionError(f"Failed to connect to PostgreSQL: {str(e)}")
@@ -86,12 +458,13 @@ class PostgreSQLDriver(BaseDriver):
         """Close the database connection."""
         if self.connection:
             try:
-                # Clear prepared statements
-                for stmt_name in self._prepared_statements:
+                # Clear prepared statements in one round trip
+                if self._prepared_statements:
                     try:
                         with self.connection.cursor() as cursor:
-                            cursor.execute(f"DEALLOCATE {stmt_name}")
+                            cursor.execute("DEALLOCATE ALL")
                     except Exception:
+                        # Connection may already be broken; the pool resets it anyway
                         pass
                 
                 self._prepared_statements.clear()
@@ -108,6 +481,13 @@ class PostgreSQLDriver(BaseDriver):
                 self.connection = None
                 self._connection_time = None
         
+        if self._pipeline_connection is not None:
+            try:
+                self._pipeline_connection.close()
+            except Exception:
+                pass
+            self._pipeline_connection = None
+        
         # Close the pool
         if self.pool:
             self.pool.closeall()
@@ -133,13 +513,23 @@ class PostgreSQLDriver(BaseDriver):
         try:
             # Ensure we have a valid connection
             if not self.connection or self.connection.closed:
+                # Prepared statements belong to the old session
+                self._prepared_statements.clear()
                 self.connection = self._create_connection()
             
             # Create cursor with RealDictCursor for dict results
             cursor = self.connection.cursor(cursor_factory=extras.RealDictCursor)
             
+            # Let the server stop one row past the result limit
+            max_results = self.config.get('max_result_size', 10000)
+            query = _with_row_limit(query, max_results + 1)
+            
             # Execute query with parameters
-            if params:
+            statement_name = self._auto_prepare_name(query, params)
+            if statement_name and self._try_execute_prepared(cursor, statement_name, query, params):
+                # Seen often enough: ran as a cached server-side prepared statement
+                pass
+            elif params:
                 # Use psycopg2's parameter substitution
                 cursor.execute(query, params)
             else:
@@ -147,16 +537,13 @@ class PostgreSQLDriver(BaseDriver):
             
             # Handle results
             if cursor.description:
-                results = cursor.fetchall()
-                
-                # Convert RealDictRow to regular dict
-                results = [dict(row) for row in results]
+                # RealDictRow subclasses dict, so rows are returned as-is
+                results = cursor.fetchmany(max_results + 1)
                 
                 # Apply result size limit
-                max_results = self.config.get('max_result_size', 10000)
                 if len(results) > max_results:
-                    logger.warning(f"Result truncated from {len(results)} to {max_results} rows")
-                    results = results[:max_results]
+                    logger.warning(f"Result truncated to {max_results} rows")
+                    del results[max_results:]
                 
                 return results
             else:
@@ -172,34 +559,206 @@ class PostgreSQLDriver(BaseDriver):
             if cursor:
                 cursor.close()
     
+    def execute_pipeline(self,
+                         queries: Sequence[Tuple[str, Optional[Dict[str, Any]]]]) -> List[List[Dict[str, Any]]]:
+        """
+        Execute several queries in one network burst.
+        
+        With psycopg 3 installed, the queries are sent in pipeline mode
+        on a dedicated connection, so none waits for the previous
+        result. Without it, they run one after another on the regular
+        connection.
+        
+        Args:
+            queries: Sequence of (query, params) pairs
+            
+        Returns:
+            Results for each query, in the order given
+        """
+        if not self.connection:
+            raise ConnectionError("Not connected to database")
+        
+        try:
+            import psycopg
+            from psycopg.rows import dict_row
+        except ImportError:
+            return [self._execute_with_timeout(query, params) for query, params in queries]
+        
+        max_results = self.config.get('max_result_size', 10000)
+        connection = self._get_pipeline_connection(psycopg)
+        
+        try:
+            cursors = []
+            with connection.pipeline():
+                for query, params in queries:
+                    cursor = connection.cursor(row_factory=dict_row)
+                    cursor.execute(_with_row_limit(query, max_results + 1), params or None)
+                    cursors.append(cursor)
+            
+            results = []
+            for cursor in cursors:
+                if cursor.description:
+                    rows = cursor.fetchmany(max_results + 1)
+                    if len(rows) > max_results:
+                        logger.warning(f"Result truncated to {max_results} rows")
+                        del rows[max_results:]
+                    results.append(rows)
+                else:
+                    results.append([{'affected_rows': cursor.rowcount}])
+                cursor.close()
+            
+            connection.commit()
+            return results
+            
+        except psycopg.Error as e:
+            connection.rollback()
+            raise ExecutionError(f"Pipeline execution failed: {str(e)}")
+    
+    def _get_pipeline_connection(self, psycopg):
+        """Open (once) the psycopg 3 connection used for pipelined queries."""
+        if self._pipeline_connection is None or self._pipeline_connection.closed:
+            params = dict(self._conn_params)
+            # libpq calls it dbname; psycopg2 accepted database as an alias
+            params['dbname'] = params.pop('database')
+            try:
+                self._pipeline_connection = psycopg.connect(**params)
+            except psycopg.Error as e:
+                raise ConnectionError(f"Failed to open pipeline connection: {str(e)}")
+        return self._pipeline_connection
+    
+    def iter_results(self,
+                     query: str,
+                     params: Optional[Dict[str, Any]] = None,
+                     batch_size: int = 1000) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream query results in batches through a server-side cursor.
+        
+        Args:
+            query: Native query string with parameter placeholders
+            params: Parameter values for the query
+            batch_size: Number of rows per yielded batch
+            
+        Yields:
+            Lists of result rows as dictionaries
+        """
+        if not self.connection:
+            raise ConnectionError("Not connected to database")
+        
+        name = f"cognidb_stream_{next(self._cursor_ids)}"
+        try:
+            with _read_transaction(self.connection):
+                with self.connection.cursor(name=name, cursor_factory=extras.RealDictCursor) as cursor:
+                    cursor.execute(query, params)
+                    while True:
+                        batch = cursor.fetchmany(batch_size)
+                        if not batch:
+                            break
+                        yield batch
+        except (OperationalError, DatabaseError) as e:
+            raise ExecutionError(f"Query execution failed: {str(e)}")
+    
+    def execute_many(self,
+                     query: str,
+                     seq_of_params: Sequence[Any],
+                     page_size: int = 1000) -> int:
+        """
+        Execute a statement for many parameter sets in batched round trips.
+        
+        ``INSERT ... VALUES %s`` queries are expanded into multi-row
+        VALUES lists with execute_values; anything else is sent in pages
+        with execute_batch.
+        
+        Args:
+            query: Statement with parameter placeholders
+            seq_of_params: Parameter tuples/dicts, one per execution
+            page_size: Number of parameter sets sent per round trip
+            
+        Returns:
+            Number of parameter sets executed
+        """
+        if not self.connection:
+            raise ConnectionError("Not connected to database")
+        
+        try:
+            with self.connection.cursor() as cursor:
+                if _INSERT_VALUES_RE.match(query):
+                    extras.execute_values(cursor, query, seq_of_params, page_size=page_size)
+                else:
+                    extras.execute_batch(cursor, query, seq_of_params, page_size=page_size)
+            self.connection.commit()
+            return len(seq_of_params)
+            
+        except (OperationalError, DatabaseError) as e:
+            self.connection.rollback()
+            raise ExecutionError(f"Batch execution failed: {str(e)}")
+    
+    def bulk_load(self,
+                  table: str,
+                  columns: Sequence[str],
+                  rows: Iterable[Sequence[Any]]) -> int:
+        """
+        Load rows into a table with COPY FROM STDIN.
+        
+        COPY skips the per-statement parse and plan of INSERT, so it is
+        the fastest way to load many rows. Rows are streamed to the
+        server as they are read, so rows may be a generator.
+        
+        Args:
+            table: Table name, optionally schema-qualified
+            columns: Column names, in the order values appear in each row
+            rows: Value sequences, one per row; None loads as NULL
+            
+        Returns:
+            Number of rows loaded
+        """
+        if not self.connection:
+            raise ConnectionError("Not connected to database")
+        
+        statement = sql.SQL("COPY {} ({}) FROM STDIN").format(
+            sql.Identifier(*table.split('.')),
+            sql.SQL(', ').join(map(sql.Identifier, columns))
+        )
+        stream = _CopyStream(rows)
+        
+        try:
+            with self.connection.cursor() as cursor:
+                cursor.copy_expert(statement, stream)
+            self.connection.commit()
+            return stream.row_count
+            
+        except (OperationalError, DatabaseError) as e:
+            self.connection.rollback()
+            raise ExecutionError(f"Bulk load failed: {str(e)}")
+    
     def execute_prepared(self, 
                         name: str,
                         query: str,
-                        params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-        """Execute a prepared statement for better performance."""
+                        params: Optional[Dict[str, Any]] = None,
+                        param_types: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Execute a prepared statement for better performance.
+        
+        The query's %(name)s or %s placeholders are rewritten to $1..$n
+        when the statement is prepared, and params are bound in that
+        order on every EXECUTE.
+        
+        Args:
+            name: Statement name
+            query: Query with psycopg2-style placeholders
+            params: Parameter values for the query
+            param_types: Optional PostgreSQL type per parameter, in order
+        """
         cursor = None
         
         try:
             cursor = self.connection.cursor(cursor_factory=extras.RealDictCursor)
             
-            # Prepare statement if not already prepared
-            if name not in self._prepared_statements:
-                cursor.execute(f"PREPARE {name} AS {query}")
-                self._prepared_statements[name] = query
-            
-            # Execute prepared statement
-            if params:
-                execute_query = sql.SQL("EXECUTE {} ({})").format(
-                    sql.Identifier(name),
-                    sql.SQL(', ').join(sql.Placeholder() * len(params))
-                )
-                cursor.execute(execute_query, list(params.values()))
-            else:
-                cursor.execute(f"EXECUTE {name}")
+            # Prepare statement if not already prepared, then execute it
+            self._execute_prepared_statement(cursor, name, query, params, param_types)
             
             # Fetch results
             if cursor.description:
-                return [dict(row) for row in cursor.fetchall()]
+                return cursor.fetchall()
             else:
                 self.connection.commit()
                 return [{'affected_rows': cursor.rowcount}]
@@ -212,6 +771,139 @@ class PostgreSQLDriver(BaseDriver):
             if cursor:
                 cursor.close()
     
+    def _execute_prepared_statement(self,
+                                    cursor,
+                                    name: str,
+                                    query: str,
+                                    params: Any = None,
+                                    param_types: Optional[List[str]] = None):
+        """EXECUTE a named statement, preparing it first if needed."""
+        statement = self._prepared_statements.get(name)
+        if statement is None:
+            statement = self._prepare_statement(cursor, name, query, param_types, bool(params))
+        else:
+            self._prepared_statements.move_to_end(name)
+        
+        # Bind params in the statement's $1..$n order
+        args = _bind_args(statement[1], params)
+        if args:
+            execute_query = sql.SQL("EXECUTE {} ({})").format(
+                sql.Identifier(name),
+                sql.SQL(', ').join(sql.Placeholder() * len(args))
+            )
+            cursor.execute(execute_query, args)
+        else:
+            cursor.execute(sql.SQL("EXECUTE {}").format(sql.Identifier(name)))
+    
+    def _try_execute_prepared(self, cursor, name: str, query: str, params: Any) -> bool:
+        """
+        Run an auto-prepared statement, returning False if the server won't prepare it.
+        
+        Client-side interpolation accepts more than PREPARE does (e.g. an
+        untyped SELECT %(x)s). Only a failed PREPARE is undone, inside a
+        savepoint when the caller has a transaction open, and the query
+        is never prepared again; the caller then runs it unprepared.
+        Errors from EXECUTE itself are real query errors and propagate.
+        """
+        if name not in self._prepared_statements:
+            in_transaction = self.connection.info.transaction_status != TRANSACTION_STATUS_IDLE
+            if in_transaction:
+                cursor.execute("SAVEPOINT cdb_prepare")
+            try:
+                self._prepare_statement(cursor, name, query, has_params=bool(params))
+            except OperationalError:
+                # Connection loss, cancellation, deadlock: not about preparability
+                raise
+            except DatabaseError as e:
+                logger.debug(f"Running {name} unprepared: {e}")
+                if in_transaction:
+                    cursor.execute("ROLLBACK TO SAVEPOINT cdb_prepare")
+                else:
+                    self.connection.rollback()
+                self._never_prepare.add(name)
+                return False
+            if in_transaction:
+                cursor.execute("RELEASE SAVEPOINT cdb_prepare")
+        
+        self._execute_prepared_statement(cursor, name, query, params)
+        return True
+    
+    def _auto_prepare_name(self, query: str, params: Any) -> Optional[str]:
+        """
+        Statement name for a query that should run prepared, or None.
+        
+        A query is prepared once it has been executed prepare_threshold
+        times (default 2; 0 disables). DDL and other non-plannable
+        statements are skipped, as are tuple params, which psycopg2
+        expands client-side into IN lists, and queries the server
+        already refused to prepare.
+        """
+        threshold = self.config.get('prepare_threshold', 2)
+        if not threshold or not _PREPARABLE_RE.match(query):
+            return None
+        values = params.values() if isinstance(params, Mapping) else (params or ())
+        if any(isinstance(value, tuple) for value in values):
+            return None
+        
+        # Without params psycopg2 sends the text verbatim, so it prepares differently
+        prefix = "cdb_" if params else "cdb_raw_"
+        name = f"{prefix}{hashlib.blake2b(query.encode(), digest_size=8).hexdigest()}"
+        if name in self._prepared_statements:
+            return name
+        if name in self._never_prepare:
+            return None
+        
+        # Bounded usage counts for not-yet-prepared queries
+        if len(self._query_counts) > 4 * self.config.get('statement_cache_size', 256):
+            self._query_counts.clear()
+        if len(self._never_prepare) > 4 * self.config.get('statement_cache_size', 256):
+            self._never_prepare.clear()
+        count = self._query_counts.get(name, 0) + 1
+        self._query_counts[name] = count
+        return name if count >= threshold else None
+    
+    def _prepare_statement(self,
+                           cursor,
+                           name: str,
+                           query: str,
+                           param_types: Optional[List[str]] = None,
+                           has_params: bool = True) -> Tuple[str, Tuple[Optional[str], ...]]:
+        """
+        PREPARE a statement, evicting the least recently used beyond statement_cache_size.
+        
+        Like psycopg2, placeholders and %% escapes are only interpreted
+        when the query has params; otherwise the text is prepared as-is.
+        """
+        if has_params:
+            positional_query, names = _to_positional(query)
+        else:
+            positional_query, names = query, ()
+        
+        types = sql.SQL("")
+        if param_types:
+            if len(param_types) != len(names):
+                raise ExecutionError(
+                    f"Expected {len(names)} parameter types, got {len(param_types)}"
+                )
+            for param_type in param_types:
+                if not _PARAM_TYPE_RE.match(param_type):
+                    raise ExecutionError(f"Invalid parameter type: {param_type}")
+            types = sql.SQL(" ({})").format(sql.SQL(', ').join(map(sql.SQL, param_types)))
+        
+        cursor.execute(sql.SQL("PREPARE {}{} AS {}").format(
+            sql.Identifier(name), types, sql.SQL(positional_query)
+        ))
+        statement = (query, names)
+        self._prepared_statements[name] = statement
+        
+        # Release the least recently used statements on the server
+        max_statements = self.config.get('statement_cache_size', 256)
+        while len(self._prepared_statements) > max_statements:
+            evicted, _ = self._prepared_statements.popitem(last=False)
+            cursor.execute(sql.SQL("DEALLOCATE {}").format(sql.Identifier(evicted)))
+        
+        return statement
+    
     def explain_query(self, query: str, analyze: bool = False) -> Dict[str, Any]:
         """Get query execution plan."""
         explain_query = f"EXPLAIN {'ANALYZE' if analyze else ''} {query}"
@@ -225,8 +917,8 @@ class PostgreSQLDriver(BaseDriver):
         except Exception as e:
             raise ExecutionError(f"Failed to explain query: {str(e)}")
     
-    def _fetch_schema_impl(self) -> Dict[str, Dict[str, str]]:
-        """Fetch PostgreSQL schema using information_schema."""
+    def _fetch_schema_impl(self, connection=None) -> Dict[str, Dict[str, str]]:
+        """Fetch PostgreSQL schema using information_schema, on self.connection by default."""
         query = """
         SELECT 
             t.table_name,
@@ -254,46 +946,48 @@ class PostgreSQLDriver(BaseDriver):
         ORDER BY t.table_name, c.ordinal_position
         """
         
-        cursor = None
-        try:
-            cursor = self.connection.cursor(cursor_factory=extras.RealDictCursor)
-            cursor.execute(query)
-            
+        # One transaction for both reads; named cursors need one and it must not be left idle
+        connection = connection or self.connection
+        with _read_transaction(connection):
             schema = {}
-            for row in cursor:
-                table_name = row['table_name']
-                if table_name not in schema:
-                    schema[table_name] = {}
-                
-                # Build column type
-                col_type = row['data_type']
-                if row['character_maximum_length']:
-                    col_type += f"({row['character_maximum_length']})"
-                elif row['numeric_precision']:
-                    col_type += f"({row['numeric_precision']}"
-                    if row['numeric_scale']:
-                        col_type += f",{row['numeric_scale']}"
-                    col_type += ")"
-                
-                if row['is_nullable'] == 'NO':
-                    col_type += ' NOT NULL'
-                if row['constraint_type'] == 'PRIMARY KEY':
-                    col_type += ' PRIMARY KEY'
-                if row['column_default']:
-                    col_type += ' DEFAULT'
-                
-                schema[table_name][row['column_name']] = col_type
+            for row in self._stream_rows('cognidb_schema', query, connection=connection):
+                schema.setdefault(row['table_name'], {})[row['column_name']] = _format_type(row)
             
             # Fetch indexes
-            self._fetch_indexes(schema, cursor)
-            
-            return schema
-            
+            self._fetch_indexes(schema, connection)
+        
+        return schema
+    
+    def _fetch_schema_background(self) -> Dict[str, Dict[str, str]]:
+        """Fetch the schema on a pooled connection, never the caller's self.connection."""
+        conn_pool = self.pool
+        if not conn_pool:
+            raise ConnectionError("Connection pool not initialized")
+        
+        connection = conn_pool.getconn()
+        try:
+            return self._fetch_schema_impl(connection)
         finally:
-            if cursor:
-                cursor.close()
+            conn_pool.putconn(connection)
+    
+    def _stream_rows(self,
+                     name: str,
+                     query: str,
+                     params: Optional[Dict[str, Any]] = None,
+                     connection=None):
+        """
+        Iterate a query's rows through a named (server-side) cursor.
+        
+        Rows are pulled itersize at a time instead of loading the whole
+        result on the client. Must run inside a transaction on the
+        connection (self.connection by default).
+        """
+        with (connection or self.connection).cursor(name=name, cursor_factory=extras.RealDictCursor) as cursor:
+            cursor.itersize = self.config.get('fetch_batch_size', 2000)
+            cursor.execute(query, params)
+            yield from cursor
     
-    def _fetch_indexes(self, schema: Dict[str, Dict[str, str]], cursor):
+    def _fetch_indexes(self, schema: Dict[str, Dict[str, str]], connection=None):
         """Fetch index information."""
         query = """
         SELECT 
@@ -306,15 +1000,10 @@ class PostgreSQLDriver(BaseDriver):
         ORDER BY tablename, indexname
         """
         
-        cursor.execute(query)
-        
-        for row in cursor:
+        for row in self._stream_rows('cognidb_indexes', query, connection=connection):
             table_name = row['tablename']
             if table_name in schema:
-                index_key = f"{table_name}_indexes"
-                if index_key not in schema:
-                    schema[index_key] = []
-                schema[index_key].append(f"{row['indexname']}")
+                schema.setdefault(f"{table_name}_indexes", []).append(row['indexname'])
     
     def _begin_transaction(self):
         """Begin a transaction."""
@@ -359,6 +1048,9 @@ class PostgreSQLDriver(BaseDriver):
             except Exception:
                 pass
         
+        if self.pool:
+            info['pool'] = self.pool.stats()
+        
         return info
     
     @property
@@ -1,21 +1,34 @@
 """Access control and permissions management."""
 
-from typing import Dict, List, Set, Optional
+from typing import Any, Dict, FrozenSet, Iterable, List, Set, Optional
 from dataclasses import dataclass, field
-from enum import Enum, auto
+from enum import IntFlag
 from ..core.exceptions import SecurityError
 
 
-class Permission(Enum):
-    """Database permissions."""
-    SELECT = auto()
-    INSERT = auto()
-    UPDATE = auto()
-    DELETE = auto()
-    CREATE = auto()
-    DROP = auto()
-    ALTER = auto()
-    EXECUTE = auto()
+class Permission(IntFlag):
+    """Database permissions, one bit each so sets of them fit in an int mask."""
+    SELECT = 1
+    INSERT = 2
+    UPDATE = 4
+    DELETE = 8
+    CREATE = 16
+    DROP = 32
+    ALTER = 64
+    EXECUTE = 128
+
+
+def _permission_mask(permissions: Iterable[Permission]) -> int:
+    """Combine permissions into a bitmask."""
+    mask = 0
+    for permission in permissions:
+        mask |= permission
+    return int(mask)
+
+
+def _permissions_from_mask(mask: int) -> Set[Permission]:
+    """Expand a bitmask back into its permissions."""
+    return {permission for permission in Permission if mask & permission}
 
 
 @dataclass
@@ -23,9 +36,18 @@ class TablePermissions:
     """Permissions for a specific table."""
     table_name: str
     allowed_operations: Set[Permission] = field(default_factory=set)
-    allowed_columns: Optional[Set[str]] = None  # None means all columns
+    allowed_columns: Optional[FrozenSet[str]] = None  # None means all columns
     row_filter: Optional[str] = None  # SQL condition for row-level security
     
+    def __setattr__(self, name, value):
+        # Keep the operation bitmask in step with allowed_operations
+        if name == 'allowed_operations':
+            value = frozenset(value)
+            object.__setattr__(self, 'operations_mask', _permission_mask(value))
+        elif name == 'allowed_columns' and value is not None:
+            value = frozenset(value)
+        object.__setattr__(self, name, value)
+    
     def can_access_column(self, column: str) -> bool:
         """Check if column access is allowed."""
         if self.allowed_columns is None:
@@ -34,7 +56,27 @@ class TablePermissions:
     
     def can_perform_operation(self, operation: Permission) -> bool:
         """Check if operation is allowed."""
-        return operation in self.allowed_operations
+        return bool(self.operations_mask & operation)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dict, with operations as a bitmask."""
+        return {
+            'table_name': self.table_name,
+            'operations': self.operations_mask,
+            'columns': sorted(self.allowed_columns) if self.allowed_columns is not None else None,
+            'row_filter': self.row_filter
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TablePermissions':
+        """Create table permissions from a dict produced by to_dict."""
+        columns = data.get('columns')
+        return cls(
+            table_name=data['table_name'],
+            allowed_operations=_permissions_from_mask(data.get('operations', 0)),
+            allowed_columns=set(columns) if columns is not None else None,
+            row_filter=data.get('row_filter')
+        )
 
 
 @dataclass
@@ -48,6 +90,13 @@ class UserPermissions:
     max_execution_time: int = 30  # seconds
     allowed_schemas: Set[str] = field(default_factory=set)
     
+    def __setattr__(self, name, value):
+        # Keep the global permission bitmask in step with global_permissions
+        if name == 'global_permissions':
+            value = frozenset(value)
+            object.__setattr__(self, 'global_mask', _permission_mask(value))
+        object.__setattr__(self, name, value)
+    
     def add_table_permission(self, table_perm: TablePermissions):
         """Add permissions for a table."""
         self.table_permissions[table_perm.table_name] = table_perm
@@ -62,9 +111,37 @@ class UserPermissions:
         """Check if user can perform operation on table."""
         if self.is_admin:
             return True
-        if table not in self.table_permissions:
-            return False
-        return self.table_permissions[table].can_perform_operation(operation)
+        
+        # operations_mask is kept in step with allowed_operations, so read it live
+        table_perm = self.table_permissions.get(table)
+        return table_perm is not None and bool(table_perm.operations_mask & operation)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dict, with permissions as bitmasks."""
+        return {
+            'user_id': self.user_id,
+            'is_admin': self.is_admin,
+            'table_permissions': [perm.to_dict() for perm in self.table_permissions.values()],
+            'global_permissions': self.global_mask,
+            'max_rows_per_query': self.max_rows_per_query,
+            'max_execution_time': self.max_execution_time,
+            'allowed_schemas': sorted(self.allowed_schemas)
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'UserPermissions':
+        """Create user permissions from a dict produced by to_dict."""
+        user = cls(
+            user_id=data['user_id'],
+            is_admin=data.get('is_admin', False),
+            global_permissions=_permissions_from_mask(data.get('global_permissions', 0)),
+            max_rows_per_query=data.get('max_rows_per_query', 10000),
+            max_execution_time=data.get('max_execution_time', 30),
+            allowed_schemas=set(data.get('allowed_schemas', ()))
+        )
+        for table_perm in data.get('table_permissions', ()):
+            user.add_table_permission(TablePermissions.from_dict(table_perm))
+        return user
 
 
 class AccessController:
@@ -125,11 +202,16 @@ class AccessController:
         if permissions.is_admin:
             return
         
-        if table in permissions.table_permissions:
-            table_perm = permissions.table_permissions[table]
-            for column in columns:
-                if not table_perm.can_access_column(column):
-                    raise SecurityError(f"Access denied to column: {table}.{column}")
+        table_perm = permissions.table_permissions.get(table)
+        if table_perm is None or table_perm.allowed_columns is None:
+            return
+        
+        allowed = table_perm.allowed_columns
+        denied = [column for column in columns if column not in allowed]
+        if denied:
+            raise SecurityError(
+                f"Access denied to columns: {', '.join(f'{table}.{column}' for column in denied)}"
+            )
     
     def check_operation(self, user_id: str, operation: Permission, tables: List[str]) -> None:
         """
@@ -141,7 +223,7 @@ class AccessController:
         permissions = self.get_user_permissions(user_id)
         
         # Check global permissions first
-        if operation in permissions.global_permissions:
+        if permissions.global_mask & operation:
             return
         
         # Check table-specific permissions
@@ -1,10 +1,44 @@
 """SQL query parser for security validation."""
 
 import re
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 import sqlparse
-from sqlparse.sql import IdentifierList, Identifier, Token
-from sqlparse.tokens import Keyword, DML
+from sqlparse.sql import IdentifierList, Identifier, Where
+from sqlparse.lexer import tokenize
+from sqlparse.tokens import Keyword, DML, Punctuation
+
+# Literals, quoted identifiers and comments (kept verbatim), or a whitespace run
+_WHITESPACE_RE = re.compile(
+    r"""('(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|`[^`]*`|--[^\n]*\n?|#[^\n]*\n?|/\*.*?\*/)|\s+""",
+    re.DOTALL
+)
+
+# Fast path for single-table-list SELECTs that need no tokenizer
+_RE_SELECT = re.compile(r'^\s*SELECT\s+(?P<cols>.*?)\s+FROM\s+(?P<rest>.*)$', re.IGNORECASE | re.DOTALL)
+_RE_CLAUSE = re.compile(r'\b(?:WHERE|GROUP\s+BY|ORDER\s+BY|HAVING|LIMIT|OFFSET)\b', re.IGNORECASE)
+_RE_KW = re.compile(r'\b(JOIN|UNION|WHERE|HAVING|GROUP\s+BY|ORDER\s+BY)\b', re.IGNORECASE)
+_RE_SUBQ = re.compile(r'\bSELECT\b', re.IGNORECASE)
+# Anything the fast path can't reason about: literals, comments, batches, CTEs
+_RE_COMPLEX = re.compile(r"""['"`;#]|--|/\*|\bWITH\b""", re.IGNORECASE)
+_RE_COLUMN = re.compile(
+    r'(?!(?:DISTINCT|ALL)\b)(?:\w+\.)?(?P<name>\w+|\*)(?:\s+(?:AS\s+)?(?P<alias>\w+))?',
+    re.IGNORECASE
+)
+_RE_TABLE = re.compile(r'(?P<name>\w+)(?:\s+(?:AS\s+)?(?P<alias>\w+))?', re.IGNORECASE)
+
+# Keyword sets compared against sqlparse's (upper-cased) token.normalized
+_JOIN_KW = frozenset({
+    'JOIN', 'INNER JOIN', 'CROSS JOIN', 'NATURAL JOIN', 'STRAIGHT_JOIN',
+    'LEFT JOIN', 'RIGHT JOIN', 'FULL JOIN',
+    'LEFT OUTER JOIN', 'RIGHT OUTER JOIN', 'FULL OUTER JOIN'
+})
+_UNION_KW = frozenset({'UNION', 'UNION ALL'})
+
+
+def _normalize(query: str) -> str:
+    """Collapse whitespace outside literals and comments."""
+    return _WHITESPACE_RE.sub(lambda m: m.group(1) or ' ', query.strip())
 
 
 class SQLQueryParser:
@@ -15,9 +49,17 @@ class SQLQueryParser:
     potential security issues.
     """
     
-    def __init__(self):
-        """Initialize the parser."""
-        self.parsed_cache = {}
+    def __init__(self, cache_size: int = 1024):
+        """
+        Initialize the parser.
+        
+        Args:
+            cache_size: Number of parsed queries kept in the LRU cache
+        """
+        # Keyed on the normalized query text, so formatting variants share an entry
+        self._parse_cached = lru_cache(maxsize=cache_size)(self._parse)
+        # Keyed on the raw text, so repeated queries skip normalization too
+        self._parse_raw_cached = lru_cache(maxsize=cache_size)(self._parse_raw)
     
     def parse(self, query: str) -> Dict[str, Any]:
         """
@@ -39,136 +81,195 @@ class SQLQueryParser:
                 'complexity': 5
             }
         """
-        # Clean and normalize query
-        query = query.strip()
+        return self._parse_raw_cached(query)
+    
+    def _parse_raw(self, query: str) -> Dict[str, Any]:
+        """Normalize a query and parse it through the normalized-text cache."""
+        return self._parse_cached(_normalize(query))
+    
+    def _parse(self, query: str) -> Dict[str, Any]:
+        """Parse a normalized query (uncached)."""
+        result = self._analyze_simple(query)
+        if result is None:
+            # Parse with sqlparse
+            parsed = sqlparse.parse(query)[0]
+            result = self._analyze(parsed)
         
-        # Check cache
-        cache_key = hash(query)
-        if cache_key in self.parsed_cache:
-            return self.parsed_cache[cache_key]
+        result['complexity'] = self._calculate_complexity(result)
         
-        # Parse with sqlparse
-        parsed = sqlparse.parse(query)[0]
+        return result
+    
+    @staticmethod
+    def _get_statement_type(statement: str) -> str:
+        """Extract the main query type from the token stream, outside parentheses."""
+        depth = 0
+        for ttype, value in tokenize(statement):
+            if ttype is Punctuation:
+                if value == '(':
+                    depth += 1
+                elif value == ')':
+                    depth -= 1
+            elif ttype is DML and depth == 0:
+                return value.upper()
+        return "UNKNOWN"
+    
+    def _analyze(self, parsed) -> Dict[str, Any]:
+        """
+        Extract query structure in a single walk over the statement.
         
+        Top-level tokens drive the clause state (SELECT list, FROM list,
+        WHERE, ...); grouped tokens are flattened once to find nested
+        SELECTs and UNIONs.
+        """
         result = {
-            'type': self._get_query_type(parsed),
-            'tables': self._extract_tables(parsed),
-            'columns': self._extract_columns(parsed),
-            'has_subquery': self._has_subquery(parsed),
-            'has_union': self._has_union(query),
-            'has_join': self._has_join(parsed),
-            'has_where': self._has_where(parsed),
-            'has_having': self._has_having(parsed),
-            'has_order_by': self._has_order_by(parsed),
-            'has_group_by': self._has_group_by(parsed),
-            'complexity': self._calculate_complexity(parsed)
+            'type': 'UNKNOWN',
+            'tables': [],
+            'columns': [],
+            'has_subquery': False,
+            'has_union': False,
+            'has_join': False,
+            'has_where': False,
+            'has_having': False,
+            'has_order_by': False,
+            'has_group_by': False
         }
+        tables = result['tables']
+        columns = result['columns']
         
-        # Cache result
-        self.parsed_cache[cache_key] = result
+        # Clause whose identifiers are being collected: 'select', 'from' or None
+        clause = None
         
-        return result
-    
-    def _get_query_type(self, parsed) -> str:
-        """Extract the main query type."""
         for token in parsed.tokens:
+            if token.is_whitespace:
+                continue
+            
             if token.ttype is DML:
-                return token.value.upper()
-        return "UNKNOWN"
-    
-    def _extract_tables(self, parsed) -> List[str]:
-        """Extract table names from the query."""
-        tables = []
-        from_seen = False
-        
-        for token in parsed.tokens:
-            if from_seen:
-                if isinstance(token, IdentifierList):
-                    for identifier in token.get_identifiers():
-                        tables.append(self._get_name(identifier))
-                elif isinstance(token, Identifier):
-                    tables.append(self._get_name(token))
-                elif token.ttype is None:
-                    tables.append(token.value)
+                value = token.normalized
+                if result['type'] == 'UNKNOWN':
+                    result['type'] = value
+                    if value == 'SELECT':
+                        clause = 'select'
+                elif value == 'SELECT':
+                    # Any further SELECT, nested or UNIONed, counts as a subquery
+                    result['has_subquery'] = True
+                continue
             
-            if token.ttype is Keyword and token.value.upper() == 'FROM':
-                from_seen = True
-            elif token.ttype is Keyword and token.value.upper() in ('WHERE', 'GROUP', 'ORDER', 'HAVING'):
-                from_seen = False
+            if token.ttype is Keyword:
+                value = token.normalized
+                if value == 'FROM':
+                    clause = 'from'
+                elif value in _JOIN_KW:
+                    result['has_join'] = True
+                    clause = 'from'
+                elif value in _UNION_KW:
+                    result['has_union'] = True
+                    clause = None
+                elif value == 'GROUP BY':
+                    result['has_group_by'] = True
+                    clause = None
+                elif value == 'ORDER BY':
+                    result['has_order_by'] = True
+                    clause = None
+                elif value == 'HAVING':
+                    result['has_having'] = True
+                    clause = None
+                elif not (clause == 'select' and value == 'DISTINCT'):
+                    clause = None
+                continue
+            
+            if token.is_group:
+                # Nested statements only appear inside grouped tokens
+                for leaf in token.flatten():
+                    if leaf.ttype is DML and leaf.normalized == 'SELECT':
+                        result['has_subquery'] = True
+                    elif leaf.ttype is Keyword and leaf.normalized in _UNION_KW:
+                        result['has_union'] = True
+                
+                if isinstance(token, Where):
+                    result['has_where'] = True
+                    clause = None
+                    continue
+            
+            if clause == 'select':
+                self._collect_names(token, columns)
+            elif clause == 'from':
+                self._collect_names(token, tables)
         
-        return [t.strip() for t in tables if t.strip()]
+        return result
     
-    def _extract_columns(self, parsed) -> List[str]:
-        """Extract column names from SELECT clause."""
-        columns = []
-        select_seen = False
+    def _analyze_simple(self, query: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract query structure with regexes for plain SELECTs.
         
-        for token in parsed.tokens:
-            if select_seen and token.ttype is Keyword:
-                break
-            
-            if select_seen:
-                if isinstance(token, IdentifierList):
-                    for identifier in token.get_identifiers():
-                        columns.append(self._get_name(identifier))
-                elif isinstance(token, Identifier):
-                    columns.append(self._get_name(token))
-                elif token.ttype is None and token.value not in (',', ' '):
-                    columns.append(token.value)
-            
-            if token.ttype is DML and token.value.upper() == 'SELECT':
-                select_seen = True
+        Handles a single SELECT over a comma-separated table list with
+        optional WHERE/GROUP BY/HAVING/ORDER BY/LIMIT clauses. Returns
+        None for anything else (joins, unions, subqueries, literals,
+        comments), which then goes through sqlparse.
+        """
+        if _RE_COMPLEX.search(query) or len(_RE_SUBQ.findall(query)) != 1:
+            return None
+        
+        match = _RE_SELECT.match(query)
+        if not match:
+            return None
+        
+        rest = match.group('rest')
+        clause = _RE_CLAUSE.search(rest)
+        table_list = rest[:clause.start()] if clause else rest
+        tail = rest[clause.start():] if clause else ''
+        
+        columns = self._match_list(_RE_COLUMN, match.group('cols'))
+        tables = self._match_list(_RE_TABLE, table_list)
+        if columns is None or tables is None:
+            return None
+        
+        keywords = {kw.upper().split()[0] for kw in _RE_KW.findall(tail)}
+        if 'JOIN' in keywords or 'UNION' in keywords:
+            return None
         
-        return [c.strip() for c in columns if c.strip()]
+        return {
+            'type': 'SELECT',
+            'tables': tables,
+            'columns': [c for c in columns if c != '*'],
+            'has_subquery': False,
+            'has_union': False,
+            'has_join': False,
+            'has_where': 'WHERE' in keywords,
+            'has_having': 'HAVING' in keywords,
+            'has_order_by': 'ORDER' in keywords,
+            'has_group_by': 'GROUP' in keywords
+        }
+    
+    @staticmethod
+    def _match_list(pattern, text: str) -> Optional[List[str]]:
+        """Names in a comma-separated list, or None if any item doesn't fully match."""
+        names = []
+        for item in text.split(','):
+            match = pattern.fullmatch(item.strip())
+            if not match:
+                return None
+            names.append(match.group('alias') or match.group('name'))
+        return names
+    
+    def _collect_names(self, token, names: List[str]):
+        """Append the identifier names held by a token."""
+        if isinstance(token, IdentifierList):
+            for identifier in token.get_identifiers():
+                name = self._get_name(identifier).strip()
+                if name:
+                    names.append(name)
+        elif isinstance(token, Identifier) or token.ttype is None:
+            name = self._get_name(token).strip()
+            if name:
+                names.append(name)
     
     def _get_name(self, identifier) -> str:
         """Get the name from an identifier."""
         if hasattr(identifier, 'get_name'):
-            return identifier.get_name()
+            return identifier.get_name() or str(identifier)
         return str(identifier)
     
-    def _has_subquery(self, parsed) -> bool:
-        """Check if query contains subqueries."""
-        query_str = str(parsed)
-        # Simple check for nested SELECT
-        return query_str.count('SELECT') > 1
-    
-    def _has_union(self, query: str) -> bool:
-        """Check if query contains UNION."""
-        return bool(re.search(r'\bUNION\b', query, re.IGNORECASE))
-    
-    def _has_join(self, parsed) -> bool:
-        """Check if query contains JOIN."""
-        for token in parsed.tokens:
-            if token.ttype is Keyword and 'JOIN' in token.value.upper():
-                return True
-        return False
-    
-    def _has_where(self, parsed) -> bool:
-        """Check if query has WHERE clause."""
-        for token in parsed.tokens:
-            if token.ttype is Keyword and token.value.upper() == 'WHERE':
-                return True
-        return False
-    
-    def _has_having(self, parsed) -> bool:
-        """Check if query has HAVING clause."""
-        for token in parsed.tokens:
-            if token.ttype is Keyword and token.value.upper() == 'HAVING':
-                return True
-        return False
-    
-    def _has_order_by(self, parsed) -> bool:
-        """Check if query has ORDER BY clause."""
-        query_str = str(parsed).upper()
-        return 'ORDER BY' in query_str
-    
-    def _has_group_by(self, parsed) -> bool:
-        """Check if query has GROUP BY clause."""
-        query_str = str(parsed).upper()
-        return 'GROUP BY' in query_str
-    
-    def _calculate_complexity(self, parsed) -> int:
+    def _calculate_complexity(self, info: Dict[str, Any]) -> int:
         """
         Calculate query complexity score.
         
@@ -178,23 +279,23 @@ class SQLQueryParser:
         score = 1  # Base score
         
         # Add complexity for various features
-        if self._has_subquery(parsed):
+        if info['has_subquery']:
             score += 3
-        if self._has_union(str(parsed)):
+        if info['has_union']:
             score += 2
-        if self._has_join(parsed):
+        if info['has_join']:
             score += 2
-        if self._has_where(parsed):
+        if info['has_where']:
             score += 1
-        if self._has_group_by(parsed):
+        if info['has_group_by']:
             score += 2
-        if self._has_having(parsed):
+        if info['has_having']:
             score += 2
-        if self._has_order_by(parsed):
+        if info['has_order_by']:
             score += 1
         
         # Add complexity for number of tables
-        tables = self._extract_tables(parsed)
+        tables = info['tables']
         if len(tables) > 1:
             score += len(tables) - 1
         
@@ -211,16 +312,17 @@ class SQLQueryParser:
             Error message if invalid, None if valid
         """
         try:
-            parsed = sqlparse.parse(query)
-            if not parsed:
+            # Split and lex only; building sqlparse's grouped tree isn't needed here
+            statements = sqlparse.split(query)
+            if not statements:
                 return "Empty or invalid query"
             
             # Check for multiple statements
-            if len(parsed) > 1:
+            if len(statements) > 1:
                 return "Multiple statements not allowed"
             
             # Get query type
-            query_type = self._get_query_type(parsed[0])
+            query_type = self._get_statement_type(statements[0])
             if query_type == "UNKNOWN":
                 return "Unknown query type"
             
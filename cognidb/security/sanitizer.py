@@ -1,9 +1,28 @@
 """Input sanitization utilities."""
 
 import re
+import sys
+import math
 import html
+from functools import lru_cache
 from typing import Any, Dict, List, Union
 
+# Non-ASCII characters, which ALLOWED_NL_CHARS never allows (or which are whitespace)
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7f]')
+
+# ASCII bytes that can't appear in an identifier, deleted in one bytes.translate pass
+_ID_CHARS = b'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_'
+_ID_DELETE = bytes(code for code in range(128) if code not in _ID_CHARS)
+
+# LIKE special characters, each escaped with a backslash in one pass
+_LIKE_ESCAPE_RE = re.compile(r'([\\%_])')
+_WILDCARD_RE = re.compile(r'([%_])')
+
+
+def _ascii_translation(disallowed) -> Dict[int, str]:
+    """str.translate table mapping each ASCII character the pattern matches to a space."""
+    return {code: ' ' for code in range(128) if disallowed.match(chr(code))}
+
 
 class InputSanitizer:
     """
@@ -16,8 +35,12 @@ class InputSanitizer:
     4. Natural language queries
     """
     
+    # Stateless; instances carry no __dict__
+    __slots__ = ()
+    
     # Characters allowed in natural language queries
     ALLOWED_NL_CHARS = re.compile(r'[^a-zA-Z0-9\s\-_.,!?\'"\(\)%$#@]')
+    _NL_TRANSLATION = _ascii_translation(ALLOWED_NL_CHARS)
     
     # Maximum lengths for various inputs
     MAX_NATURAL_LANGUAGE_LENGTH = 500
@@ -42,7 +65,9 @@ class InputSanitizer:
         query = query[:InputSanitizer.MAX_NATURAL_LANGUAGE_LENGTH]
         
         # Remove potentially harmful characters while preserving readability
-        query = InputSanitizer.ALLOWED_NL_CHARS.sub(' ', query)
+        query = query.translate(InputSanitizer._NL_TRANSLATION)
+        if not query.isascii():
+            query = _NON_ASCII_RE.sub(' ', query)
         
         # Normalize whitespace
         query = ' '.join(query.split())
@@ -53,6 +78,7 @@ class InputSanitizer:
         return query.strip()
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def sanitize_identifier(identifier: str) -> str:
         """
         Sanitize database identifier (table/column name).
@@ -69,11 +95,12 @@ class InputSanitizer:
         if not identifier:
             raise ValueError("Identifier cannot be empty")
         
-        # Remove any quotes or special characters
-        identifier = re.sub(r'[^a-zA-Z0-9_]', '', identifier)
+        # Remove any quotes or special characters (non-ASCII included)
+        identifier = identifier.encode('ascii', 'ignore').translate(None, _ID_DELETE).decode('ascii')
         
         # Ensure it starts with a letter or underscore
-        if not re.match(r'^[a-zA-Z_]', identifier):
+        first = identifier[:1]
+        if not (first.isalpha() or first == '_'):
             identifier = f"_{identifier}"
         
         # Truncate if too long
@@ -82,7 +109,8 @@ class InputSanitizer:
         if not identifier:
             raise ValueError("Identifier contains no valid characters")
         
-        return identifier
+        # Interned to match the interned names in cached schemas
+        return sys.intern(identifier)
     
     @staticmethod
     def sanitize_string_value(value: str, allow_wildcards: bool = False) -> str:
@@ -107,7 +135,7 @@ class InputSanitizer:
         
         # Handle SQL wildcards
         if not allow_wildcards:
-            value = value.replace('%', '\\%').replace('_', '\\_')
+            value = _WILDCARD_RE.sub(r'\\\1', value)
         
         # Note: Actual SQL escaping should be done by parameterized queries
         # This is just an additional safety layer
@@ -129,14 +157,17 @@ class InputSanitizer:
             return value
         
         if isinstance(value, str):
+            # Integers are the common case; anything else gets one float attempt
             try:
-                # Try to parse as float first
-                if '.' in value:
-                    return float(value)
-                else:
-                    return int(value)
+                return int(value)
+            except ValueError:
+                pass
+            try:
+                number = float(value)
             except ValueError:
                 return None
+            # 'nan' and 'inf' parse as floats but aren't usable values
+            return number if math.isfinite(number) else None
         
         return None
     
@@ -184,28 +215,55 @@ class InputSanitizer:
         if not isinstance(data, dict):
             raise ValueError("Input must be a dictionary")
         
+        # Bound once; these are called for every entry
+        sanitize_key = InputSanitizer.sanitize_identifier
+        handler_for = InputSanitizer._VALUE_HANDLERS.get
+        sanitize_other = InputSanitizer._sanitize_other_value
+        
         sanitized = {}
-        for key, value in data.items():
-            # Sanitize key
-            safe_key = InputSanitizer.sanitize_identifier(key)
-            
-            # Sanitize value based on type
-            if isinstance(value, str):
-                sanitized[safe_key] = InputSanitizer.sanitize_string_value(value)
-            elif isinstance(value, (int, float)):
-                sanitized[safe_key] = InputSanitizer.sanitize_numeric_value(value)
-            elif isinstance(value, (list, tuple, set)):
-                sanitized[safe_key] = InputSanitizer.sanitize_list_value(value)
-            elif isinstance(value, dict):
-                sanitized[safe_key] = InputSanitizer.sanitize_dict_value(value)
-            elif value is None:
-                sanitized[safe_key] = None
-            else:
-                # Convert to string and sanitize
-                sanitized[safe_key] = InputSanitizer.sanitize_string_value(str(value))
+        # (source, target) pairs; nested dicts are filled from the stack, not by recursion
+        stack = [(data, sanitized)]
+        while stack:
+            source, target = stack.pop()
+            for key, value in source.items():
+                # Sanitize key
+                safe_key = sanitize_key(key)
+                
+                # Sanitize value based on type, by exact type first
+                handler = handler_for(type(value))
+                if handler is not None:
+                    target[safe_key] = handler(value)
+                elif isinstance(value, dict):
+                    target[safe_key] = nested = {}
+                    stack.append((value, nested))
+                else:
+                    target[safe_key] = sanitize_other(value)
         
         return sanitized
     
+    @staticmethod
+    def _sanitize_other_value(value: Any) -> Any:
+        """Sanitize a value whose exact type has no handler (e.g. bool, subclasses)."""
+        if isinstance(value, str):
+            return InputSanitizer.sanitize_string_value(value)
+        if isinstance(value, (int, float)):
+            return InputSanitizer.sanitize_numeric_value(value)
+        if isinstance(value, (list, tuple, set)):
+            return InputSanitizer.sanitize_list_value(value)
+        # Convert to string and sanitize
+        return InputSanitizer.sanitize_string_value(str(value))
+    
+    # sanitize_dict_value handlers by exact type; nested dicts are handled there
+    _VALUE_HANDLERS = {
+        str: sanitize_string_value.__func__,
+        int: sanitize_numeric_value.__func__,
+        float: sanitize_numeric_value.__func__,
+        list: sanitize_list_value.__func__,
+        tuple: sanitize_list_value.__func__,
+        set: sanitize_list_value.__func__,
+        type(None): lambda value: None
+    }
+    
     @staticmethod
     def escape_like_pattern(pattern: str) -> str:
         """
@@ -218,10 +276,7 @@ class InputSanitizer:
             Escaped pattern
         """
         # Escape LIKE special characters
-        pattern = pattern.replace('\\', '\\\\')
-        pattern = pattern.replace('%', '\\%')
-        pattern = pattern.replace('_', '\\_')
-        return pattern
+        return _LIKE_ESCAPE_RE.sub(r'\\\1', pattern)
     
     @staticmethod
     def validate_and_sanitize_limit(limit: Any) -> int:
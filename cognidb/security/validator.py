@@ -1,13 +1,21 @@
 """Security validator implementation."""
 
 import re
+import sys
+from functools import lru_cache
 from typing import Tuple, Optional, List, Set
 from ..core.interfaces import SecurityValidator
-from ..core.query_intent import QueryIntent, QueryType
+from ..core.query_intent import QueryIntent, QueryType, ConditionGroup
 from ..core.exceptions import SecurityError
 from .query_parser import SQLQueryParser
 
 
+@lru_cache(maxsize=4096)
+def _unquote_identifier(identifier: str) -> str:
+    """Strip whitespace and quoting from an identifier, interned like schema names."""
+    return sys.intern(identifier.strip().strip('"\'`[]'))
+
+
 class QuerySecurityValidator(SecurityValidator):
     """
     Comprehensive security validator for queries.
@@ -19,6 +27,8 @@ class QuerySecurityValidator(SecurityValidator):
     4. Value sanitization
     """
     
+    __slots__ = ('_allowed_operations', 'max_query_complexity', 'allow_subqueries', 'parser')
+    
     # Dangerous SQL keywords that should never appear
     FORBIDDEN_KEYWORDS = {
         'DROP', 'DELETE', 'TRUNCATE', 'UPDATE', 'INSERT', 'ALTER',
@@ -26,20 +36,41 @@ class QuerySecurityValidator(SecurityValidator):
         'EXEC', 'CALL', 'MERGE', 'LOCK', 'UNLOCK'
     }
     
-    # Patterns that might indicate SQL injection
-    SQL_INJECTION_PATTERNS = [
+    # Patterns that might indicate SQL injection, split by whether they
+    # can only match where one of _SCREEN_CHARS appears
+    _PUNCTUATED_INJECTION_PATTERNS = [
         r';\s*--',  # Statement termination followed by comment
         r';\s*\/\*',  # Statement termination followed by comment
-        r'UNION\s+SELECT',  # UNION-based injection
         r'OR\s+1\s*=\s*1',  # Classic SQL injection
         r'OR\s+\'1\'\s*=\s*\'1\'',  # Classic SQL injection with quotes
-        r'WAITFOR\s+DELAY',  # Time-based injection
         r'BENCHMARK\s*\(',  # MySQL time-based injection
         r'PG_SLEEP\s*\(',  # PostgreSQL time-based injection
         r'LOAD_FILE\s*\(',  # File system access
+    ]
+    _KEYWORD_INJECTION_PATTERNS = [
+        r'UNION\s+SELECT',  # UNION-based injection
+        r'WAITFOR\s+DELAY',  # Time-based injection
         r'INTO\s+OUTFILE',  # File system write
         r'xp_cmdshell',  # SQL Server command execution
     ]
+    SQL_INJECTION_PATTERNS = _PUNCTUATED_INJECTION_PATTERNS + _KEYWORD_INJECTION_PATTERNS
+    
+    # Every byte except ';', '=' and '(' -- deleting them leaves only screen characters
+    _SCREEN_CHARS = b';=('
+    _SCREEN_DELETE = bytes(range(256)).translate(None, _SCREEN_CHARS)
+    
+    # Compiled once; re's internal cache is small and locked on every lookup.
+    # All keywords in one alternation so the query is scanned once, not per keyword
+    _FORBIDDEN_RE = re.compile(r'\b(' + '|'.join(sorted(FORBIDDEN_KEYWORDS)) + r')\b', re.IGNORECASE)
+    # Condition values are matched anywhere, not just on word boundaries
+    _FORBIDDEN_VALUE_RE = re.compile('|'.join(sorted(FORBIDDEN_KEYWORDS)), re.IGNORECASE)
+    # Injection patterns fused the same way; the keyword-only subset is used
+    # when the query has none of the screen characters
+    _INJECTION_RE = re.compile('|'.join(SQL_INJECTION_PATTERNS), re.IGNORECASE)
+    _KEYWORD_INJECTION_RE = re.compile('|'.join(_KEYWORD_INJECTION_PATTERNS), re.IGNORECASE)
+    
+    # Line and block comments, removed from string values in one scan
+    _COMMENT_RE = re.compile(r'--[^\n]*|/\*.*?\*/', re.DOTALL)
     
     # Valid identifier pattern (alphanumeric + underscore)
     VALID_IDENTIFIER_PATTERN = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*$')
@@ -47,6 +78,12 @@ class QuerySecurityValidator(SecurityValidator):
     # Maximum identifier length
     MAX_IDENTIFIER_LENGTH = 64
     
+    # Comma-joined list of valid identifiers, to check a whole intent in one match
+    _IDENTIFIER_LIST_RE = re.compile(
+        rf'[a-zA-Z_][a-zA-Z0-9_]{{0,{MAX_IDENTIFIER_LENGTH - 1}}}'
+        rf'(?:,[a-zA-Z_][a-zA-Z0-9_]{{0,{MAX_IDENTIFIER_LENGTH - 1}}})*'
+    )
+    
     def __init__(self, 
                  allowed_operations: Optional[List[str]] = None,
                  max_query_complexity: int = 10,
@@ -83,20 +120,27 @@ class QuerySecurityValidator(SecurityValidator):
         if query_intent.query_type.name not in self.allowed_operations:
             return False, f"Query type {query_intent.query_type.name} is not allowed"
         
-        # Validate table names
-        for table in query_intent.tables:
-            if not self._is_valid_identifier(table):
-                return False, f"Invalid table name: {table}"
+        # Check every identifier in one match; only when that fails do the
+        # per-identifier checks below run, to name the invalid one
+        identifiers_valid = self._all_identifiers_valid(query_intent)
         
-        # Validate column names
-        for column in query_intent.columns:
-            if column.name != "*" and not self._is_valid_identifier(column.name):
-                return False, f"Invalid column name: {column.name}"
-            if column.table and not self._is_valid_identifier(column.table):
-                return False, f"Invalid table reference in column: {column.table}"
+        is_valid_identifier = self._is_valid_identifier
+        
+        if not identifiers_valid:
+            # Validate table names
+            for table in query_intent.tables:
+                if not is_valid_identifier(table):
+                    return False, f"Invalid table name: {table}"
+            
+            # Validate column names
+            for column in query_intent.columns:
+                if column.name != "*" and not is_valid_identifier(column.name):
+                    return False, f"Invalid column name: {column.name}"
+                if column.table and not is_valid_identifier(column.table):
+                    return False, f"Invalid table reference in column: {column.table}"
         
         # Check query complexity
-        complexity = self._calculate_complexity(query_intent)
+        complexity = self._calculate_complexity(query_intent, self.max_query_complexity)
         if complexity > self.max_query_complexity:
             return False, f"Query too complex (score: {complexity}, max: {self.max_query_complexity})"
         
@@ -107,18 +151,41 @@ class QuerySecurityValidator(SecurityValidator):
                 return False, error
         
         # Validate joins
-        for join in query_intent.joins:
-            if not self._is_valid_identifier(join.left_table):
-                return False, f"Invalid table in join: {join.left_table}"
-            if not self._is_valid_identifier(join.right_table):
-                return False, f"Invalid table in join: {join.right_table}"
-            if not self._is_valid_identifier(join.left_column):
-                return False, f"Invalid column in join: {join.left_column}"
-            if not self._is_valid_identifier(join.right_column):
-                return False, f"Invalid column in join: {join.right_column}"
+        if not identifiers_valid:
+            for join in query_intent.joins:
+                if not is_valid_identifier(join.left_table):
+                    return False, f"Invalid table in join: {join.left_table}"
+                if not is_valid_identifier(join.right_table):
+                    return False, f"Invalid table in join: {join.right_table}"
+                if not is_valid_identifier(join.left_column):
+                    return False, f"Invalid column in join: {join.left_column}"
+                if not is_valid_identifier(join.right_column):
+                    return False, f"Invalid column in join: {join.right_column}"
         
         return True, None
     
+    def _all_identifiers_valid(self, query_intent: QueryIntent) -> bool:
+        """Check all table, column and join identifiers of an intent with one regex match."""
+        names = list(query_intent.tables)
+        for column in query_intent.columns:
+            if column.name != "*":
+                names.append(column.name)
+            if column.table:
+                names.append(column.table)
+        for join in query_intent.joins:
+            names.extend((join.left_table, join.right_table, join.left_column, join.right_column))
+        
+        try:
+            joined = ','.join(names)
+        except TypeError:
+            # A non-string name; let the per-identifier checks report it
+            return False
+        
+        # A name containing the separator would read as several valid names
+        if joined.count(',') != len(names) - 1:
+            return False
+        return self._IDENTIFIER_LIST_RE.fullmatch(joined) is not None
+    
     def validate_native_query(self, query: str) -> Tuple[bool, Optional[str]]:
         """
         Validate native SQL query for security issues.
@@ -128,18 +195,20 @@ class QuerySecurityValidator(SecurityValidator):
         2. SQL injection pattern matching
         3. Query parsing and analysis
         """
-        # Normalize query for analysis
-        normalized_query = query.upper().strip()
-        
         # Check for forbidden keywords
-        for keyword in self.FORBIDDEN_KEYWORDS:
-            if re.search(rf'\b{keyword}\b', normalized_query):
-                return False, f"Forbidden keyword detected: {keyword}"
+        match = self._FORBIDDEN_RE.search(query)
+        if match:
+            return False, f"Forbidden keyword detected: {match.group(1).upper()}"
         
-        # Check for SQL injection patterns
-        for pattern in self.SQL_INJECTION_PATTERNS:
-            if re.search(pattern, normalized_query, re.IGNORECASE):
-                return False, f"Potential SQL injection pattern detected"
+        # Check for SQL injection patterns, skipping the punctuated ones when
+        # a single translate pass shows the query has none of their characters
+        if query.encode('ascii', 'ignore').translate(None, self._SCREEN_DELETE):
+            injection_re = self._INJECTION_RE
+        else:
+            injection_re = self._KEYWORD_INJECTION_RE
+        match = injection_re.search(query)
+        if match:
+            return False, f"Potential SQL injection pattern detected: {match.group(0)}"
         
         # Parse and validate query structure
         try:
@@ -169,8 +238,8 @@ class QuerySecurityValidator(SecurityValidator):
         Raises:
             SecurityError: If identifier cannot be sanitized safely
         """
-        # Remove any quotes
-        identifier = identifier.strip().strip('"\'`[]')
+        # Remove any quotes (cached, since identifiers come from a small vocabulary)
+        identifier = _unquote_identifier(identifier)
         
         # Validate
         if not self._is_valid_identifier(identifier):
@@ -188,36 +257,58 @@ class QuerySecurityValidator(SecurityValidator):
         Returns:
             Sanitized value
         """
-        if value is None:
-            return None
+        # Exact types dispatch with one dict lookup
+        handler = self._VALUE_SANITIZERS.get(type(value))
+        if handler is not None:
+            return handler(self, value)
         
+        # Subclasses of the handled types
         if isinstance(value, str):
-            # Remove any SQL comment indicators
-            value = re.sub(r'--.*$', '', value, flags=re.MULTILINE)
-            value = re.sub(r'/\*.*?\*/', '', value, flags=re.DOTALL)
-            
-            # Escape special characters
-            # Note: Actual escaping should be done by the database driver
-            # This is just an additional safety layer
-            value = value.replace('\x00', '')  # Remove null bytes
-            
-        elif isinstance(value, (list, tuple)):
-            # Recursively sanitize collections
-            return type(value)(self.sanitize_value(v) for v in value)
+            return self._sanitize_string(value)
+        if isinstance(value, (list, tuple)):
+            return self._sanitize_sequence(value)
+        if isinstance(value, dict):
+            return self._sanitize_mapping(value)
         
-        elif isinstance(value, dict):
-            # Recursively sanitize dictionaries
-            return {k: self.sanitize_value(v) for k, v in value.items()}
+        return value
+    
+    def _sanitize_string(self, value: str) -> str:
+        """Strip comments and null bytes from a string value."""
+        # Remove any SQL comment indicators
+        if '--' in value or '/*' in value:
+            value = self._COMMENT_RE.sub('', value)
         
+        # Escape special characters
+        # Note: Actual escaping should be done by the database driver
+        # This is just an additional safety layer
+        if '\x00' in value:
+            value = value.replace('\x00', '')  # Remove null bytes
         return value
     
+    def _sanitize_sequence(self, value):
+        """Recursively sanitize a list or tuple."""
+        return type(value)(self.sanitize_value(v) for v in value)
+    
+    def _sanitize_mapping(self, value: dict) -> dict:
+        """Recursively sanitize a dictionary's values."""
+        return {k: self.sanitize_value(v) for k, v in value.items()}
+    
+    # sanitize_value handlers by exact type, called as handler(self, value)
+    _VALUE_SANITIZERS = {
+        str: _sanitize_string,
+        list: _sanitize_sequence,
+        tuple: _sanitize_sequence,
+        dict: _sanitize_mapping
+    }
+    
     def _is_valid_identifier(self, identifier: str) -> bool:
         """Check if an identifier is valid."""
         if not identifier or len(identifier) > self.MAX_IDENTIFIER_LENGTH:
             return False
-        return bool(self.VALID_IDENTIFIER_PATTERN.match(identifier))
+        # Same as VALID_IDENTIFIER_PATTERN for ASCII, without the regex engine
+        return identifier.isascii() and identifier.isidentifier()
     
-    def _calculate_complexity(self, query_intent: QueryIntent) -> int:
+    def _calculate_complexity(self, query_intent: QueryIntent, limit: Optional[int] = None) -> int:
         """
         Calculate query complexity score.
         
@@ -227,6 +318,9 @@ class QuerySecurityValidator(SecurityValidator):
         - Number of conditions
         - Aggregations
         - Subqueries (if parsed)
+        
+        With a limit, scoring stops as soon as the score exceeds it, so
+        the result is then only a lower bound.
         """
         score = 0
         
@@ -236,10 +330,6 @@ class QuerySecurityValidator(SecurityValidator):
         # Joins add complexity
         score += len(query_intent.joins) * 2
         
-        # Conditions add complexity
-        if query_intent.conditions:
-            score += self._count_conditions(query_intent.conditions)
-        
         # Aggregations add complexity
         score += len(query_intent.aggregations)
         
@@ -251,33 +341,57 @@ class QuerySecurityValidator(SecurityValidator):
         if query_intent.having:
             score += 2
         
+        # Conditions add complexity; counted last as the only term that walks a tree
+        if query_intent.conditions:
+            if limit is not None and score > limit:
+                return score
+            budget = None if limit is None else limit - score
+            score += self._count_conditions(query_intent.conditions, budget)
+        
         return score
     
-    def _count_conditions(self, condition_group) -> int:
-        """Recursively count conditions in a group."""
+    def _count_conditions(self, condition_group, budget: Optional[int] = None) -> int:
+        """
+        Count conditions in a group, including nested groups.
+        
+        With a budget, counting stops once the count exceeds it.
+        """
         count = 0
-        for condition in condition_group.conditions:
-            if hasattr(condition, 'conditions'):  # It's a group
-                count += self._count_conditions(condition)
-            else:
-                count += 1
+        stack = [condition_group]
+        while stack:
+            for condition in stack.pop().conditions:
+                if isinstance(condition, ConditionGroup):
+                    stack.append(condition)
+                else:
+                    count += 1
+            if budget is not None and count > budget:
+                break
         return count
     
     def _validate_conditions(self, condition_group) -> Tuple[bool, Optional[str]]:
         """Validate conditions in a condition group."""
-        for condition in condition_group.conditions:
-            if hasattr(condition, 'conditions'):  # It's a group
-                valid, error = self._validate_conditions(condition)
-                if not valid:
-                    return False, error
-            else:
-                # Validate column name
-                if not self._is_valid_identifier(condition.column.name):
-                    return False, f"Invalid column in condition: {condition.column.name}"
-                
-                # Validate value isn't attempting injection
-                if isinstance(condition.value, str):
-                    if any(keyword in condition.value.upper() for keyword in self.FORBIDDEN_KEYWORDS):
-                        return False, f"Forbidden keyword in condition value"
+        is_valid_identifier = self._is_valid_identifier
+        forbidden_search = self._FORBIDDEN_VALUE_RE.search
+        
+        # Depth-first over nested groups, in order, without recursing per group
+        stack = [iter(condition_group.conditions)]
+        while stack:
+            condition = next(stack[-1], None)
+            if condition is None:
+                stack.pop()
+                continue
+            
+            if isinstance(condition, ConditionGroup):
+                stack.append(iter(condition.conditions))
+                continue
+            
+            # Validate column name
+            if not is_valid_identifier(condition.column.name):
+                return False, f"Invalid column in condition: {condition.column.name}"
+            
+            # Validate value isn't attempting injection (one case-insensitive scan)
+            value = condition.value
+            if isinstance(value, str) and forbidden_search(value):
+                return False, f"Forbidden keyword in condition value"
         
         return True, None
\ No newline at end of file
@@ -18,6 +18,9 @@ optional_requirements = {
     'vault': ['hvac>=1.2.0'],
     'redis': ['redis>=5.0.0'],
     'api': ['fastapi>=0.104.0', 'uvicorn>=0.24.0'],
+    'arrow': ['pyarrow>=14.0.0'],
+    'pipeline': ['psycopg[binary]>=3.1.0'],
+    'async': ['asyncmy>=0.2.9', 'uvloop>=0.19.0; sys_platform != "win32"'],
     'dev': [
         'pytest>=7.4.0',
         'pytest-cov>=4.1.0',
@@ -38,7 +41,7 @@ optional_requirements = {
 for line in requirements:
     if line and not line.startswith('#'):
         # Skip optional dependencies
-        if not any(opt in line.lower() for opt in ['llama', 'azure', 'hvac', 'redis', 'fastapi', 'pytest', 'sphinx']):
+        if not any(opt in line.lower() for opt in ['llama', 'azure', 'hvac', 'redis', 'fastapi', 'pyarrow', 'psycopg[', 'asyncmy', 'uvloop', 'pytest', 'sphinx']):
             core_requirements.append(line)
 
 setup(